@@ -1,171 +1,425 @@
+import asyncio
+import json
+import sys
+import threading
+from dataclasses import fields
+
+import numpy as np
 import pandas as pd
-from typing import Any, Tuple
+from pydantic import TypeAdapter
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.data_models import ManualHotelData
 from app.cli.input_utils import get_manual_input
+from app.prediction.feature_engineering import (
+    COUNT_DTYPE,
+    FLAG_DTYPE,
+    LENGTH_DTYPE,
+)
 from app.utils.logger import logger
 
+MANUAL_HOTEL_DATA_FIELDS = frozenset(f.name for f in fields(ManualHotelData))
+_MANUAL_HOTEL_DATA_ADAPTER = TypeAdapter(ManualHotelData)
 
-async def get_manual_hotel_data_from_user() -> tuple[pd.DataFrame, pd.DataFrame]:
+
+def _manual_column_dtype(name: str, field_type: Any) -> Any:
+    if name.startswith("has_") or name == "preferred_badge":
+        return FLAG_DTYPE
+    if name.startswith("num_"):
+        return COUNT_DTYPE
+    if name == "description_length":
+        return LENGTH_DTYPE
+    if field_type in (float, "float"):
+        return np.float64
+    return object
+
+
+# Column dtypes of the manual property frame, matching the extracted features.
+MANUAL_HOTEL_DATA_DTYPES: Dict[str, Any] = {
+    f.name: _manual_column_dtype(f.name, f.type) for f in fields(ManualHotelData)
+}
+
+
+def _manual_value_error(name: str, value: Any) -> Optional[str]:
     """
-    Prompts the user to manually enter hotel data and returns it as DataFrames.
+    Why `value` cannot be stored in the manual property frame's `name` column.
+
+    The flag and count columns have narrow integer dtypes, so values outside
+    their range would not fit. Flags must be 0 or 1, and counts and lengths
+    non-negative and within their dtype.
+
+    Returns:
+        Optional[str]: The reason, or None if the value is valid.
     """
-    logger.info("Starting manual data entry for hotel features.")
+    dtype = MANUAL_HOTEL_DATA_DTYPES[name]
+    if dtype is FLAG_DTYPE:
+        return None if value in (0, 1) else f"{name} must be 0 or 1, got {value}."
+    if dtype in (COUNT_DTYPE, LENGTH_DTYPE):
+        maximum = int(np.iinfo(dtype).max)
+        if not 0 <= value <= maximum:
+            return f"{name} must be between 0 and {maximum}, got {value}."
+    return None
+
+
+def _check_manual_hotel_data(manual_data: ManualHotelData) -> None:
+    """
+    Checks that every field of `manual_data` fits its column's dtype.
+
+    Raises:
+        ValueError: Listing every field whose value is out of range.
+    """
+    errors = [
+        error
+        for name, value in vars(manual_data).items()
+        if (error := _manual_value_error(name, value)) is not None
+    ]
+    if errors:
+        raise ValueError(f"Invalid manual hotel data: {' '.join(errors)}")
+
 
-    manual_data = ManualHotelData(
-        name=get_manual_input(
-            "Enter Hotel Name (e.g., Grand Hyatt)", str, "Manual Entry Hotel"
+# Columns of the hotel details frame built from manual data, in order.
+MANUAL_HOTEL_DETAILS_COLUMNS = (
+    "url",
+    "name",
+    "star_rating",
+    "guest_rating",
+    "review_count",
+    "description",
+    "most_popular_facilities",
+    "bathroom_facilities",
+    "view_type",
+    "outdoor_facilities",
+    "kitchen_facilities",
+    "room_amenities",
+    "activities",
+    "food_drink",
+    "internet_info",
+    "parking_info",
+    "services",
+    "safety_security",
+    "general_facilities",
+    "pool_info",
+    "spa_wellness",
+    "languages_spoken",
+    "property_highlights",
+    "address",
+    "coordinates",
+    "location_score",
+    "review_score_text",
+)
+
+# Facility list items implied by each manual flag, per hotel details column.
+_FACILITY_ITEMS = {
+    "bathroom_facilities": (("has_private_bathroom", "Private bathroom"),),
+    "outdoor_facilities": (("has_balcony", "Balcony"), ("has_terrace", "Terrace")),
+    "kitchen_facilities": (("has_kitchenette", "Kitchenette"),),
+    "activities": (("has_spa", "Spa"),),
+    "food_drink": (
+        ("has_restaurant", "Restaurant"),
+        ("has_bar", "Bar"),
+        ("has_breakfast", "Breakfast"),
+    ),
+    "services": (
+        ("has_room_service", "Room service"),
+        ("has_24hr_front_desk", "24-hour front desk"),
+    ),
+    "general_facilities": (
+        ("has_airport_shuttle", "Airport shuttle"),
+        ("has_family_rooms", "Family rooms"),
+        ("has_non_smoking_rooms", "Non-smoking rooms"),
+    ),
+    "spa_wellness": (("has_spa", "Spa"),),
+}
+# Single-item columns: the first applicable item wins.
+_POPULAR_FACILITY_ITEMS = (
+    ("has_pool", "Pool"),
+    ("has_free_wifi", "Free WiFi"),
+    ("has_free_parking", "Free parking"),
+)
+_ROOM_AMENITY_ITEMS = (
+    ("has_air_conditioning_detail", "Air conditioning"),
+    ("has_non_smoking_rooms", "Non-smoking rooms"),
+)
+
+
+def _facility_items(flags: Dict[str, bool], column: str) -> List[str]:
+    return [item for flag, item in _FACILITY_ITEMS[column] if flags[flag]]
+
+
+class _ManualEntryCancelled(Exception):
+    """Raised on the prompt thread once its awaiting task has been cancelled."""
+
+
+def _prompt_manual_hotel_data(cancelled: threading.Event) -> ManualHotelData:
+    """
+    Runs the blocking stdin prompts for every manual hotel feature.
+
+    A blocked `input()` cannot be interrupted, so `cancelled` is checked
+    before each prompt instead: a cancelled entry ends at the current answer
+    rather than running through the remaining prompts.
+    """
+
+    def get_input(name: str, prompt: str, type_func: type, default: Any = None) -> Any:
+        # Out-of-range answers are asked again right away, rather than failing
+        # once every prompt has been answered.
+        while True:
+            if cancelled.is_set():
+                raise _ManualEntryCancelled()
+            value = get_manual_input(prompt, type_func, default)
+            error = _manual_value_error(name, value)
+            if error is None:
+                return value
+            print(f"Invalid input. {error}")
+
+    return ManualHotelData(
+        name=get_input(
+            "name", "Enter Hotel Name (e.g., Grand Hyatt)", str, "Manual Entry Hotel"
         ),
-        hotel_link=get_manual_input(
+        hotel_link=get_input(
+            "hotel_link",
             "Enter Hotel Link (e.g., http://example.com/hotel)",
             str,
             "http://manual.entry.com",
         ),
-        star_rating=get_manual_input("Enter Star Rating (e.g., 3.5)", float, 0.0),
-        guest_rating_score=get_manual_input(
-            "Enter Guest Rating Score (e.g., 8.5)", float, 0.0
+        star_rating=get_input(
+            "star_rating", "Enter Star Rating (e.g., 3.5)", float, 0.0
+        ),
+        guest_rating_score=get_input(
+            "guest_rating_score", "Enter Guest Rating Score (e.g., 8.5)", float, 0.0
+        ),
+        reviews=get_input("reviews", "Enter Number of Reviews (e.g., 250)", float, 0.0),
+        distance_from_downtown=get_input(
+            "distance_from_downtown",
+            "Enter Distance from Downtown in km (e.g., 2.5)",
+            float,
+            0.0,
+        ),
+        distance_from_beach=get_input(
+            "distance_from_beach",
+            "Enter Distance from Beach in km (e.g., 0.3)",
+            float,
+            0.0,
+        ),
+        preferred_badge=get_input(
+            "preferred_badge", "Has Preferred Badge? (1 for Yes, 0 for No)", int, 0
         ),
-        reviews=get_manual_input("Enter Number of Reviews (e.g., 250)", float, 0.0),
-        distance_from_downtown=get_manual_input(
-            "Enter Distance from Downtown in km (e.g., 2.5)", float, 0.0
+        has_pool=get_input("has_pool", "Has Pool? (1 for Yes, 0 for No)", int, 0),
+        has_free_wifi=get_input(
+            "has_free_wifi", "Has Free WiFi? (1 for Yes, 0 for No)", int, 0
         ),
-        distance_from_beach=get_manual_input(
-            "Enter Distance from Beach in km (e.g., 0.3)", float, 0.0
+        has_free_parking=get_input(
+            "has_free_parking", "Has Free Parking? (1 for Yes, 0 for No)", int, 0
         ),
-        preferred_badge=get_manual_input(
-            "Has Preferred Badge? (1 for Yes, 0 for No)", int, 0
+        has_spa=get_input("has_spa", "Has Spa? (1 for Yes, 0 for No)", int, 0),
+        description_length=get_input(
+            "description_length",
+            "Enter Description Length (approx. number of characters)",
+            int,
+            0,
         ),
-        has_pool=get_manual_input("Has Pool? (1 for Yes, 0 for No)", int, 0),
-        has_free_wifi=get_manual_input("Has Free WiFi? (1 for Yes, 0 for No)", int, 0),
-        has_free_parking=get_manual_input(
-            "Has Free Parking? (1 for Yes, 0 for No)", int, 0
+        num_popular_facilities=get_input(
+            "num_popular_facilities", "Enter Number of Popular Facilities", int, 0
         ),
-        has_spa=get_manual_input("Has Spa? (1 for Yes, 0 for No)", int, 0),
-        description_length=get_manual_input(
-            "Enter Description Length (approx. number of characters)", int, 0
+        num_languages_spoken=get_input(
+            "num_languages_spoken", "Enter Number of Languages Spoken", int, 0
         ),
-        num_popular_facilities=get_manual_input(
-            "Enter Number of Popular Facilities", int, 0
+        has_restaurant=get_input(
+            "has_restaurant", "Has Restaurant? (1 for Yes, 0 for No)", int, 0
         ),
-        num_languages_spoken=get_manual_input(
-            "Enter Number of Languages Spoken", int, 0
+        has_bar=get_input("has_bar", "Has Bar? (1 for Yes, 0 for No)", int, 0),
+        has_breakfast=get_input(
+            "has_breakfast", "Has Breakfast? (1 for Yes, 0 for No)", int, 0
         ),
-        has_restaurant=get_manual_input(
-            "Has Restaurant? (1 for Yes, 0 for No)", int, 0
+        has_room_service=get_input(
+            "has_room_service", "Has Room Service? (1 for Yes, 0 for No)", int, 0
         ),
-        has_bar=get_manual_input("Has Bar? (1 for Yes, 0 for No)", int, 0),
-        has_breakfast=get_manual_input("Has Breakfast? (1 for Yes, 0 for No)", int, 0),
-        has_room_service=get_manual_input(
-            "Has Room Service? (1 for Yes, 0 for No)", int, 0
+        has_24hr_front_desk=get_input(
+            "has_24hr_front_desk", "Has 24hr Front Desk? (1 for Yes, 0 for No)", int, 0
         ),
-        has_24hr_front_desk=get_manual_input(
-            "Has 24hr Front Desk? (1 for Yes, 0 for No)", int, 0
+        has_airport_shuttle=get_input(
+            "has_airport_shuttle", "Has Airport Shuttle? (1 for Yes, 0 for No)", int, 0
         ),
-        has_airport_shuttle=get_manual_input(
-            "Has Airport Shuttle? (1 for Yes, 0 for No)", int, 0
+        has_family_rooms=get_input(
+            "has_family_rooms", "Has Family Rooms? (1 for Yes, 0 for No)", int, 0
         ),
-        has_family_rooms=get_manual_input(
-            "Has Family Rooms? (1 for Yes, 0 for No)", int, 0
+        has_air_conditioning_detail=get_input(
+            "has_air_conditioning_detail",
+            "Has Air Conditioning? (1 for Yes, 0 for No)",
+            int,
+            0,
         ),
-        has_air_conditioning_detail=get_manual_input(
-            "Has Air Conditioning? (1 for Yes, 0 for No)", int, 0
+        has_non_smoking_rooms=get_input(
+            "has_non_smoking_rooms",
+            "Has Non-Smoking Rooms? (1 for Yes, 0 for No)",
+            int,
+            0,
         ),
-        has_non_smoking_rooms=get_manual_input(
-            "Has Non-Smoking Rooms? (1 for Yes, 0 for No)", int, 0
+        has_private_bathroom=get_input(
+            "has_private_bathroom",
+            "Has Private Bathroom? (1 for Yes, 0 for No)",
+            int,
+            0,
         ),
-        has_private_bathroom=get_manual_input(
-            "Has Private Bathroom? (1 for Yes, 0 for No)", int, 0
+        has_kitchenette=get_input(
+            "has_kitchenette", "Has Kitchenette? (1 for Yes, 0 for No)", int, 0
         ),
-        has_kitchenette=get_manual_input(
-            "Has Kitchenette? (1 for Yes, 0 for No)", int, 0
+        has_balcony=get_input(
+            "has_balcony", "Has Balcony? (1 for Yes, 0 for No)", int, 0
         ),
-        has_balcony=get_manual_input("Has Balcony? (1 for Yes, 0 for No)", int, 0),
-        has_terrace=get_manual_input("Has Terrace? (1 for Yes, 0 for No)", int, 0),
-        discounted_price_currency=get_manual_input(
-            "Enter Currency (e.g., LKR, USD)", str, "LKR"
+        has_terrace=get_input(
+            "has_terrace", "Has Terrace? (1 for Yes, 0 for No)", int, 0
+        ),
+        discounted_price_currency=get_input(
+            "discounted_price_currency", "Enter Currency (e.g., LKR, USD)", str, "LKR"
         ),
     )
 
+
+async def get_manual_hotel_data_from_user() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Prompts the user to manually enter hotel data and returns it as DataFrames.
+
+    The prompts run in a worker thread so the event loop stays free for tasks
+    awaited alongside this one, such as the training data scrape. Cancelling
+    the call stops the prompts after the one currently waiting for input.
+    """
+    logger.info("Starting manual data entry for hotel features.")
+
+    cancelled = threading.Event()
+    try:
+        manual_data = await asyncio.to_thread(_prompt_manual_hotel_data, cancelled)
+    except asyncio.CancelledError:
+        cancelled.set()
+        logger.warning("Manual data entry cancelled. Press Enter to exit.")
+        raise
+
     logger.info("Manual data entry complete.")
 
+    return manual_hotel_data_to_frames(manual_data)
+
+
+def load_manual_hotel_data_from_file(file_path: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Reads manual hotel data from a JSON file and returns it as DataFrames.
+
+    The file holds a single object keyed by `ManualHotelData` field names;
+    missing fields keep their defaults. The whole object is validated in one
+    pass by Pydantic. A `file_path` of "-" reads the JSON from stdin, so
+    manual mode can run without the interactive prompts, e.g. from scripts.
+
+    Args:
+        file_path (str): Path to the JSON file, or "-" for stdin.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The property and hotel details DataFrames.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the input is not a JSON object, has unknown fields or
+                    values that do not validate against the field's type, or
+                    flags or counts outside their range.
+    """
+    if file_path == "-":
+        raw_data = json.load(sys.stdin)
+    else:
+        with open(file_path, "r", encoding="utf-8") as f:
+            raw_data = json.load(f)
+    if not isinstance(raw_data, dict):
+        raise ValueError(f"Manual data file {file_path} must contain a JSON object.")
+
+    unknown_fields = sorted(set(raw_data) - MANUAL_HOTEL_DATA_FIELDS)
+    if unknown_fields:
+        raise ValueError(
+            f"Unknown fields in manual data file {file_path}: {', '.join(unknown_fields)}"
+        )
+
+    manual_data = _MANUAL_HOTEL_DATA_ADAPTER.validate_python(raw_data)
+    _check_manual_hotel_data(manual_data)
+
+    logger.info(f"Loaded manual hotel data from {file_path}.")
+    return manual_hotel_data_to_frames(manual_data)
+
+
+def manual_hotel_data_to_frames(
+    manual_data: ManualHotelData,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Converts manual hotel data into property and hotel details DataFrames.
+
+    Args:
+        manual_data (ManualHotelData): The manually entered hotel features.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The property and hotel details DataFrames,
+            shaped like the scraped data.
+
+    Raises:
+        ValueError: If a flag or count is outside its column's range.
+    """
+    _check_manual_hotel_data(manual_data)
+
     # Convert manual_data to DataFrames mimicking scraped data structure
+    # Built column-wise from one-element arrays of the declared dtypes, so no
+    # column's dtype has to be inferred from its single value. This includes
+    # discounted_price_currency, which the model expects alongside the features.
     df_properties = pd.DataFrame(
-        [manual_data.__dict__]
+        {
+            name: np.array([value], dtype=MANUAL_HOTEL_DATA_DTYPES[name])
+            for name, value in vars(manual_data).items()
+        }
     )  # Simple conversion, may need more specific mapping
 
     # Create a df_hotel_details that is compatible with _extract_hotel_details_features
+    flags = {
+        name: bool(value)
+        for name, value in vars(manual_data).items()
+        if name.startswith("has_")
+    }
+    hotel_details = {
+        "url": manual_data.hotel_link,
+        "name": manual_data.name,
+        "star_rating": manual_data.star_rating,
+        "guest_rating": manual_data.guest_rating_score,
+        "review_count": manual_data.reviews,
+        # Approximate length for feature extraction
+        "description": "Manual entry description for "
+        + manual_data.name
+        + ". " * (manual_data.description_length // 20 + 1),
+        # Simplified popular facilities: the first one that applies
+        "most_popular_facilities": next(
+            ([item] for flag, item in _POPULAR_FACILITY_ITEMS if flags[flag]), []
+        ),
+        "bathroom_facilities": _facility_items(flags, "bathroom_facilities"),
+        "view_type": [],  # Not directly from manual input
+        "outdoor_facilities": _facility_items(flags, "outdoor_facilities"),
+        "kitchen_facilities": _facility_items(flags, "kitchen_facilities"),
+        "room_amenities": next(
+            ([item] for flag, item in _ROOM_AMENITY_ITEMS if flags[flag]), []
+        ),
+        "activities": _facility_items(flags, "activities"),
+        "food_drink": _facility_items(flags, "food_drink"),
+        "internet_info": "Free WiFi" if flags["has_free_wifi"] else None,
+        "parking_info": "Free parking" if flags["has_free_parking"] else None,
+        "services": _facility_items(flags, "services"),
+        "safety_security": [],  # Not directly from manual input
+        "general_facilities": _facility_items(flags, "general_facilities"),
+        "pool_info": {"type": "Outdoor swimming pool", "free": True}
+        if flags["has_pool"]
+        else None,
+        "spa_wellness": _facility_items(flags, "spa_wellness"),
+        "languages_spoken": ["English"]
+        * manual_data.num_languages_spoken,  # Simplified
+        "property_highlights": [],  # Not directly from manual input
+        # Other HotelDetails fields will be None or default as they are not manual inputs
+        "address": None,
+        "coordinates": None,
+        "location_score": None,
+        "review_score_text": None,
+    }
+    # The values are already final, so skip per-column dtype inference.
     df_hotel_details = pd.DataFrame(
-        [
-            {
-                "url": manual_data.hotel_link,
-                "name": manual_data.name,
-                "star_rating": manual_data.star_rating,
-                "guest_rating": manual_data.guest_rating_score,
-                "review_count": manual_data.reviews,
-                "description": "Manual entry description for "
-                + manual_data.name
-                + ". "
-                * (
-                    manual_data.description_length // 20 + 1
-                ),  # Approximate length for feature extraction
-                "most_popular_facilities": ["Pool"]
-                if manual_data.has_pool
-                else (
-                    ["Free WiFi"]
-                    if manual_data.has_free_wifi
-                    else (["Free parking"] if manual_data.has_free_parking else [])
-                ),  # Simplified popular facilities
-                "bathroom_facilities": ["Private bathroom"]
-                if manual_data.has_private_bathroom
-                else [],
-                "view_type": [],  # Not directly from manual input
-                "outdoor_facilities": (["Balcony"] if manual_data.has_balcony else [])
-                + (["Terrace"] if manual_data.has_terrace else []),
-                "kitchen_facilities": ["Kitchenette"]
-                if manual_data.has_kitchenette
-                else [],
-                "room_amenities": ["Air conditioning"]
-                if manual_data.has_air_conditioning_detail
-                else (
-                    ["Non-smoking rooms"] if manual_data.has_non_smoking_rooms else []
-                ),
-                "activities": ["Spa"] if manual_data.has_spa else [],
-                "food_drink": (["Restaurant"] if manual_data.has_restaurant else [])
-                + (["Bar"] if manual_data.has_bar else [])
-                + (["Breakfast"] if manual_data.has_breakfast else []),
-                "internet_info": "Free WiFi" if manual_data.has_free_wifi else None,
-                "parking_info": "Free parking"
-                if manual_data.has_free_parking
-                else None,
-                "services": (["Room service"] if manual_data.has_room_service else [])
-                + (["24-hour front desk"] if manual_data.has_24hr_front_desk else []),
-                "safety_security": [],  # Not directly from manual input
-                "general_facilities": (
-                    (["Airport shuttle"] if manual_data.has_airport_shuttle else [])
-                    + (["Family rooms"] if manual_data.has_family_rooms else [])
-                    + (
-                        ["Non-smoking rooms"]
-                        if manual_data.has_non_smoking_rooms
-                        else []
-                    )
-                ),
-                "pool_info": {"type": "Outdoor swimming pool", "free": True}
-                if manual_data.has_pool
-                else None,
-                "spa_wellness": ["Spa"] if manual_data.has_spa else [],
-                "languages_spoken": ["English"]
-                * manual_data.num_languages_spoken,  # Simplified
-                "property_highlights": [],  # Not directly from manual input
-                # Other HotelDetails fields will be None or default as they are not manual inputs
-                "address": None,
-                "coordinates": None,
-                "location_score": None,
-                "review_score_text": None,
-            }
-        ]
+        {name: [hotel_details[name]] for name in MANUAL_HOTEL_DETAILS_COLUMNS},
+        dtype=object,
     )
 
-    # Add currency column to df_properties for consistency, as it's needed for the model
-    df_properties["discounted_price_currency"] = manual_data.discounted_price_currency
-
     return df_properties, df_hotel_details
\ No newline at end of file
@@ -1,14 +1,124 @@
-from typing import Literal, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Literal, Optional, Tuple
 
 import pandas as pd
 
-from app.cli.manual_data_entry import get_manual_hotel_data_from_user
-from app.prediction.model_predictor import predict_price
-from app.scrapers.booking_com.orchestrator.scrape_booking_com_data import (
-    scrape_booking_com_data,
-)
+from app.scrapers.booking_com.processing.rate_limiter import AsyncRateLimiter
 from app.utils.logger import logger
 
+# Predictions beyond this many rows are elided from the console/log summary.
+PREDICTION_LOG_MAX_ROWS = 50
+
+# The user's property and hotel details frames, None when a source yields nothing.
+_UserData = Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]
+
+
+def _single_row_frame(obj: Any) -> pd.DataFrame:
+    """Builds a one-row DataFrame from an object's attributes, skipping records inference."""
+    return pd.DataFrame({name: [value] for name, value in vars(obj).items()})
+
+
+async def _collect_scraped_data(
+    scrape_params: Dict[str, Any],
+    target_hotel_name: Optional[str],
+    manual_props_df: Optional[pd.DataFrame],
+    manual_details_df: Optional[pd.DataFrame],
+) -> _UserData:
+    """Scrapes the target hotel (and the general training data) from Booking.com."""
+    from app.scrapers.booking_com.orchestrator.scrape_booking_com_data import (
+        scrape_booking_com_data,
+    )
+
+    if not target_hotel_name:
+        raise ValueError(
+            "If using 'scrape' data source, 'target_hotel_name' is required."
+        )
+    logger.debug(
+        "  Target Hotel Name: {target_hotel_name}",
+        target_hotel_name=target_hotel_name,
+    )
+    logger.info("Scraping data from Booking.com...")
+    (
+        specific_property,
+        specific_hotel_detail,
+    ) = await scrape_booking_com_data(
+        **scrape_params, target_hotel_name=target_hotel_name
+    )
+    logger.info("Scraping complete.")
+
+    user_df_properties = None
+    user_df_hotel_details = None
+    if specific_property:
+        user_df_properties = _single_row_frame(specific_property)
+    # Only the advanced model reads hotel details at prediction time.
+    if specific_hotel_detail and scrape_params["model_type"].lower() != "basic":
+        user_df_hotel_details = _single_row_frame(specific_hotel_detail)
+    return user_df_properties, user_df_hotel_details
+
+
+async def _collect_manual_data(
+    scrape_params: Dict[str, Any],
+    target_hotel_name: Optional[str],
+    manual_props_df: Optional[pd.DataFrame],
+    manual_details_df: Optional[pd.DataFrame],
+) -> _UserData:
+    """Uses the given (API) or prompted (CLI) hotel data, scraping training data alongside."""
+    from app.scrapers.booking_com.orchestrator.scrape_booking_com_data import (
+        scrape_booking_com_data,
+    )
+
+    # Still scrape general data for training even in manual mode
+    training_scrape = scrape_booking_com_data(
+        **scrape_params, target_hotel_name=None  # No specific target
+    )
+
+    # For API, dataframes are passed in. For CLI, we use the interactive prompt.
+    if manual_props_df is not None and manual_details_df is not None:
+        user_df_properties = manual_props_df
+        user_df_hotel_details = manual_details_df
+        logger.info("Scraping general data for training (even in manual mode)...")
+        await training_scrape
+    else:  # CLI case
+        from app.cli.manual_data_entry import get_manual_hotel_data_from_user
+
+        # Neither depends on the other, so the scrape runs while the user types.
+        logger.info(
+            "Collecting manual hotel data while scraping general data for training..."
+        )
+        scrape_task = asyncio.create_task(training_scrape)
+        manual_task = asyncio.create_task(get_manual_hotel_data_from_user())
+        try:
+            (user_df_properties, user_df_hotel_details), _ = await asyncio.gather(
+                manual_task, scrape_task
+            )
+        except BaseException:
+            # Either failing ends the run, so don't leave the other one going:
+            # no scraping without the user's hotel, no prompting without a model.
+            manual_task.cancel()
+            scrape_task.cancel()
+            raise
+        logger.info("Manual data collection complete.")
+    logger.info("General data scraping complete.")
+    return user_df_properties, user_df_hotel_details
+
+
+# Data collection strategy for each `data_source`.
+_DATA_COLLECTORS: Dict[
+    str,
+    Callable[
+        [
+            Dict[str, Any],
+            Optional[str],
+            Optional[pd.DataFrame],
+            Optional[pd.DataFrame],
+        ],
+        Awaitable[_UserData],
+    ],
+] = {
+    "scrape": _collect_scraped_data,
+    "manual": _collect_manual_data,
+}
+
 
 async def run_prediction_flow(
     data_source: Literal["scrape", "manual"],
@@ -22,83 +132,74 @@ async def run_prediction_flow(
     target_hotel_name: Optional[str] = None,
     manual_props_df: Optional[pd.DataFrame] = None,
     manual_details_df: Optional[pd.DataFrame] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
 ):
     """
     Core logic for both CLI and API to run the scraping and prediction process.
+
+    The scraper (Playwright) and predictor (TensorFlow) modules are imported
+    only once the flow actually needs them.
     """
     logger.info("\nStarting process with parameters:")
-    logger.debug(f"  Data Source: {data_source}")
-    logger.debug(f"  Destination: {destination}")
-    logger.debug(f"  Adults: {adults}")
-    logger.debug(f"  Rooms: {rooms}")
-    logger.debug(f"  Properties Limit: {properties_limit}")
-    logger.debug(f"  Hotel Details Limit: {hotel_details_limit}")
-    logger.debug(f"  Force Refetch: {force_refetch}")
-    logger.debug(f"  Prediction Model Type: {prediction_model_type}")
-
-    user_df_properties: pd.DataFrame = pd.DataFrame()
-    user_df_hotel_details: pd.DataFrame = pd.DataFrame()
+    logger.debug(
+        "  Data Source: {data_source}\n"
+        "  Destination: {destination}\n"
+        "  Adults: {adults}\n"
+        "  Rooms: {rooms}\n"
+        "  Properties Limit: {properties_limit}\n"
+        "  Hotel Details Limit: {hotel_details_limit}\n"
+        "  Force Refetch: {force_refetch}\n"
+        "  Prediction Model Type: {prediction_model_type}",
+        data_source=data_source,
+        destination=destination,
+        adults=adults,
+        rooms=rooms,
+        properties_limit=properties_limit,
+        hotel_details_limit=hotel_details_limit,
+        force_refetch=force_refetch,
+        prediction_model_type=prediction_model_type,
+    )
 
     # --- Data Collection ---
-    if data_source == "scrape":
-        if not target_hotel_name:
-            raise ValueError(
-                "If using 'scrape' data source, 'target_hotel_name' is required."
-            )
-        logger.debug(f"  Target Hotel Name: {target_hotel_name}")
-        logger.info("Scraping data from Booking.com...")
-        (
-            specific_property,
-            specific_hotel_detail,
-        ) = await scrape_booking_com_data(
-            destination=destination,
-            model_type=prediction_model_type,
-            adults=adults,
-            rooms=rooms,
-            limit=properties_limit,
-            hotel_details_limit=hotel_details_limit,
-            force_refetch=force_refetch,
-            target_hotel_name=target_hotel_name,
-        )
-        logger.info("Scraping complete.")
-        if specific_property:
-            user_df_properties = pd.DataFrame([specific_property.__dict__])
-        if specific_hotel_detail:
-            user_df_hotel_details = pd.DataFrame([specific_hotel_detail.__dict__])
-
-    elif data_source == "manual":
-        # For API, dataframes are passed in. For CLI, we use the interactive prompt.
-        if manual_props_df is not None and manual_details_df is not None:
-            user_df_properties = manual_props_df
-            user_df_hotel_details = manual_details_df
-        else:  # CLI case
-            logger.info("Collecting manual hotel data for user's property...")
-            (
-                user_df_properties,
-                user_df_hotel_details,
-            ) = await get_manual_hotel_data_from_user()
-            logger.info("Manual data collection complete.")
-
-        # Still scrape general data for training even in manual mode
-        logger.info("Scraping general data for training (even in manual mode)...")
-        await scrape_booking_com_data(
-            destination=destination,
-            model_type=prediction_model_type,
-            adults=adults,
-            rooms=rooms,
-            limit=properties_limit,
-            hotel_details_limit=hotel_details_limit,
-            force_refetch=force_refetch,
-            target_hotel_name=None,  # No specific target
-        )
-        logger.info("General data scraping complete.")
+    collect_user_data = _DATA_COLLECTORS.get(data_source)
+    if collect_user_data is None:
+        raise ValueError(f"Unknown data source: '{data_source}'.")
+
+    scrape_params: Dict[str, Any] = {
+        "destination": destination,
+        "model_type": prediction_model_type,
+        "adults": adults,
+        "rooms": rooms,
+        "limit": properties_limit,
+        "hotel_details_limit": hotel_details_limit,
+        "force_refetch": force_refetch,
+        "rate_limiter": rate_limiter,
+    }
+    # None means "nothing collected"; an empty frame means a source returned no rows.
+    user_df_properties, user_df_hotel_details = await collect_user_data(
+        scrape_params, target_hotel_name, manual_props_df, manual_details_df
+    )
 
     # --- Price Prediction ---
-    if user_df_properties.empty:
+    num_properties = (
+        len(user_df_properties.index) if user_df_properties is not None else 0
+    )
+    num_hotel_details = (
+        len(user_df_hotel_details.index) if user_df_hotel_details is not None else 0
+    )
+    if user_df_properties is None or not num_properties:
         logger.warning(
             "No data available for price prediction for the user's property."
         )
         return None
+    logger.debug(
+        "Prediction input: {num_properties} property rows, "
+        "{num_hotel_details} hotel detail rows.",
+        num_properties=num_properties,
+        num_hotel_details=num_hotel_details,
+    )
+
+    from app.prediction.model_predictor import predict_price
 
     logger.info("Predicting prices...")
     try:
@@ -113,9 +214,13 @@ async def run_prediction_flow(
             hotel_details_limit=hotel_details_limit,
         )
         logger.info("Price prediction successful!")
-        logger.info("\n--- Predicted Prices ---")
-        logger.info(predicted_prices_df.to_string())
-        logger.info("------------------------")
+        # One record, only rendered if a sink accepts it, and capped for large tables.
+        logger.opt(lazy=True).info(
+            "\n--- Predicted Prices ---\n{}\n------------------------",
+            lambda: predicted_prices_df.to_string(
+                max_rows=PREDICTION_LOG_MAX_ROWS, float_format="{:.2f}".format
+            ),
+        )
         return predicted_prices_df
 
     except FileNotFoundError as e:
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any, Dict, Optional, List # Added List for typing_extensions compatibility
 
 
@@ -30,6 +30,10 @@ class PropertyListing:
     taxes_and_fees_currency: str = ""
 
 
+# Field names in declaration order, e.g. for building DataFrame columns.
+PROPERTY_LISTING_FIELDS = tuple(f.name for f in fields(PropertyListing))
+
+
 @dataclass
 class HotelDetails:
     """Complete hotel information data structure"""
@@ -70,6 +74,9 @@ class HotelDetails:
     languages_spoken: Optional[List[str]] = None
 
 
+HOTEL_DETAILS_FIELDS = tuple(f.name for f in fields(HotelDetails))
+
+
 @dataclass
 class ManualHotelData:
     """Dataclass for manually entering hotel data for price prediction."""
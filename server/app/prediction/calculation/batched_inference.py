@@ -0,0 +1,102 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+# A queued call: its input, its result and the event it waits on, set when the
+# result is in or when the call is made the runner.
+_PendingCall = Tuple[np.ndarray, Future, threading.Event]
+
+
+class InferenceBatcher:
+    """
+    Coalesces concurrent inference calls on one model into shared batches.
+
+    Predictions run in worker threads, so several can reach the same model at
+    once. The first caller to find the batcher idle becomes the runner: it
+    stacks the queued feature matrices, its own first, into one batch, runs a
+    single inference and hands each caller its slice of the output. Callers
+    arriving meanwhile just queue up. Once its own result is in, the runner
+    hands the queue to the longest-waiting caller, who runs the next batch, so
+    no caller keeps running batches for others under sustained load. There is
+    no batching window, so a lone call is run straight away.
+
+    Usage:
+        batcher = InferenceBatcher(infer)
+        prices = batcher(X)
+    """
+
+    def __init__(
+        self, infer: Callable[[np.ndarray], np.ndarray], max_batch_rows: int = 4096
+    ) -> None:
+        if max_batch_rows <= 0:
+            raise ValueError("max_batch_rows must be positive.")
+        self._infer = infer
+        self._max_batch_rows = max_batch_rows
+        self._pending: List[_PendingCall] = []
+        self._running = False
+        self._lock = threading.Lock()
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Runs inference on `x`, possibly in one batch with other callers' rows.
+
+        Args:
+            x (np.ndarray): The input features, shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: The inference output for the rows of `x`.
+        """
+        future: Future = Future()
+        wake = threading.Event()
+        future.add_done_callback(lambda _: wake.set())
+        with self._lock:
+            self._pending.append((x, future, wake))
+            is_runner = not self._running
+            self._running = True
+        if not is_runner:
+            wake.wait()
+        if not future.done():
+            # Made the runner: this call is at the head of the queue.
+            self._run_own_batch(future)
+        return future.result()
+
+    def _next_batch(self) -> List[_PendingCall]:
+        """Takes queued calls, up to `max_batch_rows` rows but at least one call."""
+        with self._lock:
+            n_calls, n_rows = 0, 0
+            for x, _, _ in self._pending:
+                if n_calls and n_rows + len(x) > self._max_batch_rows:
+                    break
+                n_calls += 1
+                n_rows += len(x)
+            batch = self._pending[:n_calls]
+            del self._pending[:n_calls]
+            return batch
+
+    def _run_batch(self, batch: List[_PendingCall]) -> None:
+        """Runs one batch and resolves the futures of its calls."""
+        try:
+            if len(batch) == 1:
+                outputs = [self._infer(batch[0][0])]
+            else:
+                stacked = self._infer(np.concatenate([x for x, _, _ in batch]))
+                offsets = np.cumsum([len(x) for x, _, _ in batch])[:-1]
+                outputs = np.split(stacked, offsets)
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        for (_, future, _), output in zip(batch, outputs):
+            future.set_result(output)
+
+    def _run_own_batch(self, own: Future) -> None:
+        """Runs batches until `own` is resolved, then hands the queue on."""
+        while not own.done():
+            self._run_batch(self._next_batch())
+        with self._lock:
+            if self._pending:
+                self._pending[0][2].set()
+            else:
+                self._running = False
@@ -0,0 +1,114 @@
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+# (kernel, bias, activation) of one Dense layer, as float32 arrays.
+DenseLayer = Tuple[np.ndarray, np.ndarray, str]
+
+_SUPPORTED_ACTIVATIONS = ("linear", "relu")
+# Layers that are the identity at inference time.
+_PASSTHROUGH_LAYERS = ("Dropout",)
+
+
+def extract_dense_layers(model: Any) -> Optional[List[DenseLayer]]:
+    """
+    Extracts the weights of a Keras model made only of Dense (and Dropout) layers.
+
+    Args:
+        model (Any): The loaded Keras model.
+
+    Returns:
+        Optional[List[DenseLayer]]: The Dense layers in order, or None if the model
+            contains anything the NumPy forward pass does not support.
+    """
+    layers: List[DenseLayer] = []
+    for layer in model.layers:
+        layer_type = type(layer).__name__
+        if layer_type in _PASSTHROUGH_LAYERS:
+            continue
+        if layer_type != "Dense":
+            return None
+        config = layer.get_config()
+        activation = config.get("activation")
+        if activation not in _SUPPORTED_ACTIVATIONS or not config.get("use_bias"):
+            return None
+        kernel, bias = layer.get_weights()
+        layers.append(
+            (kernel.astype(np.float32), bias.astype(np.float32), activation)
+        )
+    return layers or None
+
+
+def fold_scaling(
+    layers: List[DenseLayer],
+    x_mean: np.ndarray,
+    x_inv_scale: np.ndarray,
+    y_mean: np.ndarray,
+    y_scale: np.ndarray,
+) -> List[DenseLayer]:
+    """
+    Folds the feature standardisation and the target's inverse scaling into the layers.
+
+    Standardising the input is affine, so it merges into the first layer:
+    ((x - mean) * inv_scale) @ W + b == x @ (inv_scale[:, None] * W) + b',
+    with b' = b - (mean * inv_scale) @ W. Likewise, y * scale + mean merges
+    into a linear last layer, or becomes an extra linear layer after a
+    non-linear one. The folded network maps raw features straight to prices.
+
+    Args:
+        layers (List[DenseLayer]): The layers returned by `extract_dense_layers`.
+        x_mean (np.ndarray): The feature means subtracted before the model.
+        x_inv_scale (np.ndarray): The reciprocals of the feature scales.
+        y_mean (np.ndarray): The target mean added to the model output.
+        y_scale (np.ndarray): The target scale the model output is multiplied by.
+
+    Returns:
+        List[DenseLayer]: The folded layers, as float32 arrays.
+    """
+    # Folded in float64, so only the final weights are rounded to float32.
+    folded = [
+        (kernel.astype(np.float64), bias.astype(np.float64), activation)
+        for kernel, bias, activation in layers
+    ]
+    kernel, bias, activation = folded[0]
+    folded[0] = (
+        kernel * x_inv_scale[:, None],
+        bias - (x_mean * x_inv_scale) @ kernel,
+        activation,
+    )
+    kernel, bias, activation = folded[-1]
+    if activation == "linear":
+        folded[-1] = (kernel * y_scale, bias * y_scale + y_mean, activation)
+    else:
+        folded.append((np.diag(y_scale), y_mean, "linear"))
+    return [
+        (kernel.astype(np.float32), bias.astype(np.float32), activation)
+        for kernel, bias, activation in folded
+    ]
+
+
+def dense_forward(x: np.ndarray, layers: List[DenseLayer]) -> np.ndarray:
+    """
+    Runs a Dense network's inference pass with NumPy.
+
+    For the few rows a prediction usually has, this avoids the fixed
+    per-call cost of `model.predict` (graph dispatch, batching, callbacks),
+    while each layer is still a single BLAS matrix product. The weights stay
+    float32 on purpose: NumPy has no int8 BLAS, so quantised weights would be
+    multiplied through its generic integer loops, dozens of times slower.
+
+    Args:
+        x (np.ndarray): The raw input features, shape (n_samples, n_features).
+        layers (List[DenseLayer]): The layers returned by `fold_scaling`, with
+            the feature and target scaling folded in.
+
+    Returns:
+        np.ndarray: The predicted prices, shape (n_samples, n_outputs).
+    """
+    out = np.asarray(x, dtype=np.float32)
+    for kernel, bias, activation in layers:
+        out = out @ kernel
+        out += bias
+        if activation == "relu":
+            np.maximum(out, 0.0, out=out)
+    return out
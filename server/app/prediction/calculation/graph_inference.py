@@ -0,0 +1,194 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import tensorflow as tf
+
+from app.prediction.calculation.dense_forward import (
+    DenseLayer,
+    extract_dense_layers,
+    fold_scaling,
+)
+
+_SERVING_OUTPUT = "predicted_price"
+
+
+def _bucket_size(n_rows: int) -> int:
+    """The smallest power of two holding `n_rows` rows."""
+    return 1 << max(n_rows - 1, 0).bit_length()
+
+
+def build_graph_inference(
+    model: Any,
+    n_features: int,
+    x_mean: np.ndarray,
+    x_inv_scale: np.ndarray,
+    y_mean: np.ndarray,
+    y_scale: np.ndarray,
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Wraps scaling, a Keras model's forward pass and inverse scaling in one XLA-compiled `tf.function`.
+
+    The fixed input signature (any number of rows, `n_features` columns) lets
+    the function be traced once and reused, instead of going through
+    `model.predict`'s data adapter, callbacks and per-call batching. Row
+    counts are padded to power-of-two buckets, so arbitrary request sizes
+    only ever hit a handful of compiled shapes. The feature and target
+    scaling are part of the graph, where XLA fuses them into the first and
+    last layers instead of them being separate passes on the host.
+
+    Args:
+        model (Any): The loaded Keras model.
+        n_features (int): The number of input features the model was trained on.
+        x_mean (np.ndarray): The feature means subtracted before the model.
+        x_inv_scale (np.ndarray): The reciprocals of the feature scales.
+        y_mean (np.ndarray): The target mean added to the model output.
+        y_scale (np.ndarray): The target scale the model output is multiplied by.
+
+    Returns:
+        Callable[[np.ndarray], np.ndarray]: Maps the raw input features,
+            shape (n_samples, n_features), to the predicted prices.
+    """
+    x_mean_t = tf.constant(x_mean, dtype=tf.float32)
+    x_inv_scale_t = tf.constant(x_inv_scale, dtype=tf.float32)
+    y_mean_t = tf.constant(y_mean, dtype=tf.float32)
+    y_scale_t = tf.constant(y_scale, dtype=tf.float32)
+
+    @tf.function(
+        input_signature=[tf.TensorSpec(shape=[None, n_features], dtype=tf.float32)],
+        jit_compile=True,
+    )
+    def infer(x: tf.Tensor) -> tf.Tensor:
+        scaled = (x - x_mean_t) * x_inv_scale_t
+        return model(scaled, training=False) * y_scale_t + y_mean_t
+
+    return _padded_runner(infer, n_features)
+
+
+def _padded_runner(
+    infer: Callable[[tf.Tensor], tf.Tensor], n_features: int
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Wraps an XLA-compiled function to run on power-of-two row buckets."""
+
+    def run(x: np.ndarray) -> np.ndarray:
+        # XLA compiles once per input shape, so batches are zero-padded to a
+        # power-of-two row count and the padding is sliced off the output.
+        n_rows = len(x)
+        padded = np.zeros((_bucket_size(n_rows), n_features), dtype=np.float32)
+        padded[:n_rows] = x
+        return infer(tf.constant(padded)).numpy()[:n_rows]
+
+    return run
+
+
+class _ServingModule(tf.Module):
+    """A model with its scaling fused in, plus its folded Dense weights, for export."""
+
+    def __init__(
+        self,
+        model: Any,
+        n_features: int,
+        x_mean: np.ndarray,
+        x_inv_scale: np.ndarray,
+        y_mean: np.ndarray,
+        y_scale: np.ndarray,
+        dense_layers: Optional[List[DenseLayer]],
+    ) -> None:
+        super().__init__()
+        self.model = model
+        self.x_mean = tf.constant(x_mean, dtype=tf.float32)
+        self.x_inv_scale = tf.constant(x_inv_scale, dtype=tf.float32)
+        self.y_mean = tf.constant(y_mean, dtype=tf.float32)
+        self.y_scale = tf.constant(y_scale, dtype=tf.float32)
+        # Saved alongside the graph, so the NumPy path needs no Keras model either.
+        layers = dense_layers or []
+        self.dense_kernels = [tf.Variable(k, trainable=False) for k, _, _ in layers]
+        self.dense_biases = [tf.Variable(b, trainable=False) for _, b, _ in layers]
+        self.dense_activations = tf.Variable(
+            tf.constant([a for _, _, a in layers], dtype=tf.string), trainable=False
+        )
+        self.serve = tf.function(
+            self._serve,
+            input_signature=[
+                tf.TensorSpec(shape=[None, n_features], dtype=tf.float32, name="x")
+            ],
+        )
+
+    def _serve(self, x: tf.Tensor) -> Dict[str, tf.Tensor]:
+        scaled = (x - self.x_mean) * self.x_inv_scale
+        prices = self.model(scaled, training=False) * self.y_scale + self.y_mean
+        return {_SERVING_OUTPUT: prices}
+
+
+def save_inference_model(
+    model: Any,
+    path: str,
+    n_features: int,
+    x_mean: np.ndarray,
+    x_scale: np.ndarray,
+    y_mean: np.ndarray,
+    y_scale: np.ndarray,
+) -> None:
+    """
+    Exports a trained model with its scaling fused in as a SavedModel.
+
+    The SavedModel holds one concrete `serving_default` function, mapping raw
+    features straight to prices, and the Dense weights with the scaling folded
+    in. Loading it restores that graph and those arrays directly, instead of
+    rebuilding the Keras model layer by layer from its `.keras` file.
+
+    Args:
+        model (Any): The trained Keras model.
+        path (str): The SavedModel directory to write.
+        n_features (int): The number of input features the model was trained on.
+        x_mean (np.ndarray): The feature means.
+        x_scale (np.ndarray): The feature scales.
+        y_mean (np.ndarray): The target mean.
+        y_scale (np.ndarray): The target scale.
+    """
+    x_inv_scale = 1.0 / x_scale
+    dense_layers = extract_dense_layers(model)
+    if dense_layers is not None:
+        dense_layers = fold_scaling(dense_layers, x_mean, x_inv_scale, y_mean, y_scale)
+    module = _ServingModule(
+        model, n_features, x_mean, x_inv_scale, y_mean, y_scale, dense_layers
+    )
+    tf.saved_model.save(
+        module,
+        path,
+        signatures={"serving_default": module.serve.get_concrete_function()},
+    )
+
+
+def load_inference_model(
+    path: str, n_features: int
+) -> Tuple[Callable[[np.ndarray], np.ndarray], Optional[List[DenseLayer]]]:
+    """
+    Loads a SavedModel written by `save_inference_model`.
+
+    Args:
+        path (str): The SavedModel directory.
+        n_features (int): The number of input features the model was trained on.
+
+    Returns:
+        Tuple[Callable[[np.ndarray], np.ndarray], Optional[List[DenseLayer]]]:
+            The graph inference function, like `build_graph_inference`'s, and
+            the folded Dense layers for NumPy inference (None if unsupported).
+    """
+    loaded = tf.saved_model.load(path)
+    serving = loaded.signatures["serving_default"]
+
+    @tf.function(
+        input_signature=[tf.TensorSpec(shape=[None, n_features], dtype=tf.float32)],
+        jit_compile=True,
+    )
+    def infer(x: tf.Tensor) -> tf.Tensor:
+        return serving(x=x)[_SERVING_OUTPUT]
+
+    activations = [a.decode() for a in loaded.dense_activations.numpy()]
+    dense_layers = [
+        (kernel.numpy(), bias.numpy(), activation)
+        for kernel, bias, activation in zip(
+            loaded.dense_kernels, loaded.dense_biases, activations
+        )
+    ]
+    return _padded_runner(infer, n_features), dense_layers or None
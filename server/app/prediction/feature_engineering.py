@@ -1,89 +1,214 @@
+import operator
+from itertools import repeat
+
+import numpy as np
 import pandas as pd
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 
+# The has_* flags are 0/1 and the counts stay far below 65k, so the feature
+# frame uses the narrowest dtypes that hold them instead of int64 everywhere.
+FLAG_DTYPE = np.int8
+COUNT_DTYPE = np.uint16
+# Descriptions can in principle run past the uint16 range.
+LENGTH_DTYPE = np.int32
 
-def extract_hotel_details_features(df_hotel_details: pd.DataFrame) -> pd.DataFrame:
-    """Extracts additional features from hotel details for advanced model."""
-    features_df = pd.DataFrame()
 
-    features_df["hotel_link"] = df_hotel_details[
-        "url"
-    ]  # Use url from HotelDetails for merging
+def _normalize_list_column(series: pd.Series) -> Sequence[Sequence[Any]]:
+    """
+    The column's values with every non-list (None, NaN, unparsed text) as empty.
 
-    # Boolean features (general)
-    features_df["has_pool"] = df_hotel_details["pool_info"].apply(
-        lambda x: 1 if isinstance(x, dict) and "type" in x else 0
-    )
-    features_df["has_free_wifi"] = df_hotel_details["internet_info"].apply(
-        lambda x: 1 if isinstance(x, str) and "free wifi" in x.lower() else 0
-    )
-    features_df["has_free_parking"] = df_hotel_details["parking_info"].apply(
-        lambda x: 1 if isinstance(x, str) and "free parking" in x.lower() else 0
-    )
-    features_df["has_spa"] = df_hotel_details["spa_wellness"].apply(
-        lambda x: 1 if isinstance(x, list) and len(x) > 0 else 0
-    )
+    The value types are checked once for the whole column, and a column that
+    only holds lists, the usual case, is returned as is. The per-row loops
+    over the result then need no type checks of their own.
+    """
+    values = series.to_numpy(dtype=object)
+    if set(map(type, values)) <= {list}:
+        return values
+    return [x if isinstance(x, list) else () for x in values]
 
-    # Numerical features
-    features_df["description_length"] = df_hotel_details["description"].apply(
-        lambda x: len(x) if isinstance(x, str) else 0
-    )
-    features_df["num_popular_facilities"] = df_hotel_details[
-        "most_popular_facilities"
-    ].apply(lambda x: len(x) if isinstance(x, list) else 0)
-    features_df["num_languages_spoken"] = df_hotel_details["languages_spoken"].apply(
-        lambda x: len(x) if isinstance(x, list) else 0
-    )
 
-    # More granular boolean features from list-based facilities
-    # Helper lambda for checking presence in a list of strings
-    has_feature = (
-        lambda lst, keyword: 1
-        if isinstance(lst, list) and any(keyword in item.lower() for item in lst)
-        else 0
+def _list_lengths(series: pd.Series) -> np.ndarray:
+    """Length of each list in the column, 0 for anything that is not a list."""
+    return np.fromiter(
+        map(len, _normalize_list_column(series)), dtype=np.int64, count=len(series)
     )
 
-    features_df["has_restaurant"] = df_hotel_details["food_drink"].apply(
-        lambda x: has_feature(x, "restaurant")
-    )
-    features_df["has_bar"] = df_hotel_details["food_drink"].apply(
-        lambda x: has_feature(x, "bar")
-    )
-    features_df["has_breakfast"] = df_hotel_details["food_drink"].apply(
-        lambda x: has_feature(x, "breakfast")
-    )
-    features_df["has_room_service"] = df_hotel_details["services"].apply(
-        lambda x: has_feature(x, "room service")
-    )
-    features_df["has_24hr_front_desk"] = df_hotel_details["services"].apply(
-        lambda x: has_feature(x, "24-hour front desk")
-    )
-    features_df["has_airport_shuttle"] = df_hotel_details["general_facilities"].apply(
-        lambda x: has_feature(x, "airport shuttle")
-    )
-    features_df["has_family_rooms"] = df_hotel_details["general_facilities"].apply(
-        lambda x: has_feature(x, "family rooms")
-    )
-    features_df["has_air_conditioning_detail"] = df_hotel_details[
-        "general_facilities"
-    ].apply(  # Renamed to avoid collision
-        lambda x: has_feature(x, "air conditioning")
+
+def _text_contains(series: pd.Series, keyword: str) -> np.ndarray:
+    """1 where the text value contains `keyword` (case-insensitive), else 0."""
+    # One pass per row instead of chained .str.lower() / .str.contains() /
+    # to_numpy() passes, each of which materialises a full intermediate column.
+    values = series.to_numpy(dtype=object)
+    return np.fromiter(
+        (isinstance(x, str) and keyword in x.lower() for x in values),
+        dtype=bool,
+        count=len(values),
     )
-    features_df["has_non_smoking_rooms"] = df_hotel_details["general_facilities"].apply(
-        lambda x: has_feature(x, "non-smoking rooms")
+
+
+def _text_lengths(series: pd.Series) -> np.ndarray:
+    """Length of each text value in the column, 0 for non-strings."""
+    values = series.to_numpy(dtype=object)
+    return np.fromiter(
+        (len(x) if isinstance(x, str) else 0 for x in values),
+        dtype=LENGTH_DTYPE,
+        count=len(values),
     )
-    features_df["has_private_bathroom"] = df_hotel_details["bathroom_facilities"].apply(
-        lambda x: has_feature(x, "private bathroom")
+
+
+def _joined_items(series: pd.Series) -> List[str]:
+    """Each row's list items joined on newlines and lower-cased, "" for non-lists."""
+    lists = _normalize_list_column(series)
+    try:
+        return [text.lower() for text in map("\n".join, lists)]
+    except TypeError:  # Non-string items
+        return ["\n".join(map(str, items)).lower() for items in lists]
+
+
+def _keyword_flags(
+    series: pd.Series, keywords: Dict[str, str]
+) -> Dict[str, np.ndarray]:
+    """
+    Flags, per feature name, the rows whose list has an item containing its keyword.
+
+    Each row is packed once into a lower-cased text (items joined on a newline,
+    which no keyword contains, so matches never span two items). Every keyword
+    is then one tight substring scan over those prepared texts. With only a
+    handful of keywords per column this beats a single precompiled alternation
+    regex, whose per-match Python overhead outweighs the saved passes.
+    """
+    texts = _joined_items(series)
+    # map() drives the substring tests from C, without a generator frame
+    # resumed per row; the bool results are cast when stored in the flag block.
+    return {
+        name: np.fromiter(
+            map(operator.contains, texts, repeat(keyword)),
+            dtype=bool,
+            count=len(texts),
+        )
+        for name, keyword in keywords.items()
+    }
+
+
+# Keyword flags derived from each list-valued HotelDetails column.
+LIST_KEYWORD_FEATURES: Dict[str, Dict[str, str]] = {
+    "food_drink": {
+        "has_restaurant": "restaurant",
+        "has_bar": "bar",
+        "has_breakfast": "breakfast",
+    },
+    "services": {
+        "has_room_service": "room service",
+        "has_24hr_front_desk": "24-hour front desk",
+    },
+    "general_facilities": {
+        "has_airport_shuttle": "airport shuttle",
+        "has_family_rooms": "family rooms",
+        "has_air_conditioning_detail": "air conditioning",  # Renamed to avoid collision
+        "has_non_smoking_rooms": "non-smoking rooms",
+    },
+    "bathroom_facilities": {"has_private_bathroom": "private bathroom"},
+    # "kitchen" also matches "kitchenette"
+    "kitchen_facilities": {"has_kitchenette": "kitchen"},
+    "outdoor_facilities": {
+        "has_balcony": "balcony",
+        "has_terrace": "terrace",
+    },
+}
+
+
+def binary_features(feature_columns: List[str]) -> List[str]:
+    """
+    The 0/1 features among the given model features, in order.
+
+    Trainers store this in the model metadata so predictions can cast these
+    columns without re-inspecting every feature name.
+    """
+    return [
+        col for col in feature_columns if "has_" in col or "preferred_badge" in col
+    ]
+
+
+# Flag features not derived from LIST_KEYWORD_FEATURES, in column order.
+_GENERAL_FLAG_FEATURES = ("has_pool", "has_free_wifi", "has_free_parking", "has_spa")
+FLAG_FEATURE_COLUMNS = _GENERAL_FLAG_FEATURES + tuple(
+    name for keywords in LIST_KEYWORD_FEATURES.values() for name in keywords
+)
+
+
+def _extract_features(df_hotel_details: pd.DataFrame) -> pd.DataFrame:
+    """
+    Builds the feature frame of the given hotel details rows, one row each.
+
+    The flags share one dtype, so they are written into a single preallocated
+    int8 matrix that becomes one block of the result, while the hotel link and
+    the numerical features are wrapped separately and joined once.
+    """
+    n_rows = len(df_hotel_details)
+    # One row per flag feature: each fill is contiguous, and the transpose is
+    # the column-major layout pandas stores the block in.
+    flags = np.empty((len(FLAG_FEATURE_COLUMNS), n_rows), dtype=FLAG_DTYPE)
+    flag_rows = dict(zip(FLAG_FEATURE_COLUMNS, flags))
+
+    # Boolean features (general)
+    flag_rows["has_pool"][:] = np.fromiter(
+        (isinstance(x, dict) and "type" in x for x in df_hotel_details["pool_info"]),
+        dtype=bool,
+        count=n_rows,
     )
-    features_df["has_kitchenette"] = df_hotel_details["kitchen_facilities"].apply(
-        lambda x: has_feature(x, "kitchenette")
-        or has_feature(x, "kitchen")  # Check for both
+    flag_rows["has_free_wifi"][:] = _text_contains(
+        df_hotel_details["internet_info"], "free wifi"
     )
-    features_df["has_balcony"] = df_hotel_details["outdoor_facilities"].apply(
-        lambda x: has_feature(x, "balcony")
+    flag_rows["has_free_parking"][:] = _text_contains(
+        df_hotel_details["parking_info"], "free parking"
     )
-    features_df["has_terrace"] = df_hotel_details["outdoor_facilities"].apply(
-        lambda x: has_feature(x, "terrace")
+    flag_rows["has_spa"][:] = _list_lengths(df_hotel_details["spa_wellness"]) > 0
+
+    # More granular boolean features from list-based facilities
+    for column, keywords in LIST_KEYWORD_FEATURES.items():
+        for name, values in _keyword_flags(df_hotel_details[column], keywords).items():
+            flag_rows[name][:] = values
+
+    # Numerical features
+    numerical: Dict[str, np.ndarray] = {
+        "description_length": _text_lengths(df_hotel_details["description"]),
+        "num_popular_facilities": _list_lengths(
+            df_hotel_details["most_popular_facilities"]
+        ).astype(COUNT_DTYPE),
+        "num_languages_spoken": _list_lengths(
+            df_hotel_details["languages_spoken"]
+        ).astype(COUNT_DTYPE),
+    }
+
+    return pd.concat(
+        [
+            # Use url from HotelDetails for merging
+            pd.DataFrame({"hotel_link": df_hotel_details["url"].to_numpy()}),
+            pd.DataFrame(numerical, copy=False),
+            pd.DataFrame(flags.T, columns=list(FLAG_FEATURE_COLUMNS), copy=False),
+        ],
+        axis=1,
     )
 
-    return features_df
\ No newline at end of file
+
+def extract_hotel_details_features(df_hotel_details: pd.DataFrame) -> pd.DataFrame:
+    """
+    Extracts additional features from hotel details for advanced model.
+
+    Scrapes can return the same hotel more than once. Each URL's features
+    are computed once, from its first row, and repeated for its other rows,
+    so the result still has one row per input row. Rows without a URL are
+    always treated as distinct.
+    """
+    urls = df_hotel_details["url"]
+    duplicated = (urls.duplicated() & urls.notna()).to_numpy()
+    if not duplicated.any():
+        return _extract_features(df_hotel_details)
+
+    unique_features = _extract_features(df_hotel_details[~duplicated])
+    # Each kept row's position in the unique frame; duplicates take their URL's.
+    positions = np.cumsum(~duplicated) - 1
+    url_values = urls.to_numpy(dtype=object)
+    first_positions = dict(zip(url_values[~duplicated], positions[~duplicated]))
+    positions[duplicated] = [first_positions[url] for url in url_values[duplicated]]
+    return unique_features.take(positions).reset_index(drop=True)
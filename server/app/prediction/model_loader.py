@@ -1,11 +1,137 @@
+import json
 import os
-from typing import Any, Dict
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import joblib
+import numpy as np
 import tensorflow as tf
 
+from app.prediction.calculation.batched_inference import InferenceBatcher
+from app.prediction.calculation.dense_forward import (
+    DenseLayer,
+    dense_forward,
+    extract_dense_layers,
+    fold_scaling,
+)
+from app.prediction.calculation.graph_inference import (
+    build_graph_inference,
+    load_inference_model,
+)
+from app.prediction.model_utils.scaler_params import (
+    load_scaler_params,
+    scaler_params,
+)
 from app.utils.logger import logger
-from app.utils.constants import ML_MODEL_DIR # Import ML_MODEL_DIR
+from app.utils.constants import (
+    ML_MODEL_DIR,
+    SAVED_MODEL_DIRNAME,
+    SKLEARN_MODEL_FILENAME,
+)
+
+# Loaded artifacts per model directory, together with the modification times of
+# the files they were read from. Repeat predictions against the same trained
+# model reuse them; retraining rewrites the files and so invalidates the entry.
+_ARTIFACT_CACHE: Dict[str, Tuple[Tuple[float, ...], Dict[str, Any]]] = {}
+_ARTIFACT_CACHE_LOCK = threading.Lock()
+# One lock per model directory, held while that model is loaded and warmed up,
+# so concurrent first predictions load it once without blocking other models.
+_ARTIFACT_LOAD_LOCKS: Dict[str, threading.Lock] = {}
+
+# Up to this many rows the NumPy forward pass beats a TensorFlow graph call's overhead.
+NUMPY_INFERENCE_MAX_ROWS = 4096
+# Batch sizes a freshly loaded model is run on once, so that the first real
+# predictions do not pay for graph tracing, XLA compilation or allocations.
+WARMUP_BATCH_ROWS = (1, 8, 32, 128)
+
+
+def _artifact_path(path: str, legacy_path: str) -> str:
+    """`path` if it exists, else the joblib file models trained before it used."""
+    return path if os.path.exists(path) or not os.path.exists(legacy_path) else legacy_path
+
+
+def _load_scaler(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """The mean and scale of a saved scaler, from its `.npz` or legacy joblib file."""
+    if path.endswith(".joblib"):
+        return scaler_params(joblib.load(path))
+    return load_scaler_params(path)
+
+
+def _load_meta(path: str) -> Dict[str, Any]:
+    """The model metadata, from its JSON or legacy joblib file."""
+    if path.endswith(".joblib"):
+        return joblib.load(path)
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _select_inference(
+    dense_layers: Optional[List[DenseLayer]],
+    graph_inference: Callable[[np.ndarray], np.ndarray],
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Picks the inference path by batch size: NumPy for small batches, the graph otherwise.
+
+    Both paths have the feature and target scaling fused in, so the returned
+    function maps the raw features straight to prices.
+    """
+
+    def infer(x: np.ndarray) -> np.ndarray:
+        if dense_layers is not None and len(x) <= NUMPY_INFERENCE_MAX_ROWS:
+            return dense_forward(x, dense_layers)
+        return graph_inference(x)
+
+    return infer
+
+
+def _warm_up(infer: Callable[[np.ndarray], np.ndarray], n_features: int) -> None:
+    """
+    Runs `infer` once on zeros for each warm-up batch size.
+
+    When small batches take the NumPy path, the graph is not warmed: only a
+    single request of more than `NUMPY_INFERENCE_MAX_ROWS` rows reaches it, so
+    it is compiled on that first use rather than on every model load.
+    """
+    for n_rows in WARMUP_BATCH_ROWS:
+        infer(np.zeros((n_rows, n_features), dtype=np.float32))
+
+
+def _load_keras_inference(
+    model_path: str, scaler_x_path: str, scaler_y_path: str, n_features: int
+) -> Tuple[Any, Optional[List[DenseLayer]], Callable[[np.ndarray], np.ndarray]]:
+    """
+    Builds both inference paths from a `.keras` model and its saved scalers.
+
+    Returns:
+        Tuple: The Keras model, its folded Dense layers (None if unsupported)
+            and its graph inference function.
+    """
+    # Only used for inference: skip restoring the optimizer, loss and metrics.
+    model = tf.keras.models.load_model(model_path, compile=False)
+    # The scalers' affine transforms, fused into the inference functions
+    # below instead of going through sklearn on every prediction.
+    x_mean, x_scale = _load_scaler(scaler_x_path)
+    x_inv_scale = 1.0 / x_scale
+    y_mean, y_scale = _load_scaler(scaler_y_path)
+
+    # Copied out of the model once here rather than on every prediction.
+    dense_layers = extract_dense_layers(model)
+    if dense_layers is not None:
+        dense_layers = fold_scaling(dense_layers, x_mean, x_inv_scale, y_mean, y_scale)
+
+    graph_inference = build_graph_inference(
+        model, n_features, x_mean, x_inv_scale, y_mean, y_scale
+    )
+    return model, dense_layers, graph_inference
+
+
+def _sklearn_inference(model: Any) -> Callable[[np.ndarray], np.ndarray]:
+    """The inference function of a scikit-learn regressor trained on raw features."""
+
+    def infer(x: np.ndarray) -> np.ndarray:
+        return model.predict(x).astype(np.float32).reshape(-1, 1)
+
+    return infer
 
 
 def load_model_artifacts(
@@ -14,11 +140,23 @@ def load_model_artifacts(
     """
     Loads a trained model, its scalers, and metadata.
 
+    Models trained with scikit-learn (the basic model on small datasets) are
+    loaded from their joblib file. Models exported as a SavedModel are loaded
+    from it, with the scaling already fused in. Otherwise the `.keras` model is rebuilt and combined with
+    its scalers, read from `.npz` files, or joblib files for older models.
+
+    The artifacts stay cached in-process and are reloaded only when one of the
+    files on disk has changed, e.g. after the model was retrained.
+
     Args:
         model_filename (str): The full filename of the model (e.g., "Unawatuna_2_1_100_10_price_predictor").
 
     Returns:
-        Dict[str, Any]: A dictionary containing the loaded model, scaler_X, scaler_y, and metadata.
+        Dict[str, Any]: A dictionary containing the loaded Keras or scikit-learn
+            model (None when loaded from a SavedModel), its metadata,
+            the model's Dense layer weights with the scaling folded in for NumPy
+            inference (None if unsupported), its compiled graph inference function
+            and the `inference` batcher that predictions should go through.
 
     Raises:
         FileNotFoundError: If any required model artifact is not found.
@@ -29,24 +167,91 @@ def load_model_artifacts(
     # Extract the base name from the full path for the scaler and meta files
     model_base_name = os.path.basename(base_path)
 
-    scaler_x_path = os.path.join(base_path, f"{model_base_name}_scaler_X.joblib")
-    scaler_y_path = os.path.join(base_path, f"{model_base_name}_scaler_y.joblib")
-    meta_path = os.path.join(base_path, f"{model_base_name}_meta.joblib")
+    def artifact_path(suffix: str, extension: str) -> str:
+        return _artifact_path(
+            os.path.join(base_path, f"{model_base_name}_{suffix}.{extension}"),
+            os.path.join(base_path, f"{model_base_name}_{suffix}.joblib"),
+        )
+
+    scaler_x_path = artifact_path("scaler_X", "npz")
+    scaler_y_path = artifact_path("scaler_y", "npz")
+    meta_path = artifact_path("meta", "json")
+
+    saved_model_path = os.path.join(base_path, SAVED_MODEL_DIRNAME)
+    # The SavedModel directory is complete once saved_model.pb is written.
+    saved_model_pb = os.path.join(saved_model_path, "saved_model.pb")
+    use_saved_model = os.path.exists(saved_model_pb)
+    sklearn_model_path = os.path.join(base_path, SKLEARN_MODEL_FILENAME)
+    use_sklearn = os.path.exists(sklearn_model_path)
+    if use_sklearn:
+        artifact_paths: List[str] = [sklearn_model_path, meta_path]
+    elif use_saved_model:
+        artifact_paths = [saved_model_pb, meta_path]
+    else:
+        artifact_paths = [model_path, scaler_x_path, scaler_y_path, meta_path]
 
     # Check if all model artifacts exist
-    if not all(
-        os.path.exists(p) for p in [model_path, scaler_x_path, scaler_y_path, meta_path]
-    ):
+    if not all(os.path.exists(p) for p in artifact_paths):
         raise FileNotFoundError(
             f"Model artifacts not found for {model_type} model at {base_path}. "
             "Please ensure the model has been trained first."
         )
 
-    logger.info(f"Loading model artifacts for {model_type} model from {base_path}.")
-    model = tf.keras.models.load_model(model_path)
-    scaler_X = joblib.load(scaler_x_path)
-    scaler_y = joblib.load(scaler_y_path)
-    meta = joblib.load(meta_path)
-    logger.info("Model artifacts loaded successfully.")
+    mtimes = tuple(os.path.getmtime(p) for p in artifact_paths)
+    with _ARTIFACT_CACHE_LOCK:
+        cached = _ARTIFACT_CACHE.get(base_path)
+        if cached is not None and cached[0] == mtimes:
+            logger.debug(f"Reusing loaded model artifacts from {base_path}.")
+            return cached[1]
+        load_lock = _ARTIFACT_LOAD_LOCKS.setdefault(base_path, threading.Lock())
+
+    with load_lock:
+        # Another thread may have loaded the model while this one waited.
+        with _ARTIFACT_CACHE_LOCK:
+            cached = _ARTIFACT_CACHE.get(base_path)
+        if cached is not None and cached[0] == mtimes:
+            logger.debug(f"Reusing loaded model artifacts from {base_path}.")
+            return cached[1]
+
+        logger.info(f"Loading model artifacts for {model_type} model from {base_path}.")
+        meta = _load_meta(meta_path)
+        n_features = len(meta["features"])
+        # Either way, the graph function is traced once, by the warm-up below
+        # when it serves small batches and otherwise on its first use, and
+        # then shared by every prediction with this model.
+        if use_sklearn:
+            # Trees need no scaling and are fast at any batch size, so the
+            # model itself is the only inference path.
+            model = joblib.load(sklearn_model_path)
+            dense_layers = None
+            graph_inference = _sklearn_inference(model)
+        elif use_saved_model:
+            model = None
+            graph_inference, dense_layers = load_inference_model(
+                saved_model_path, n_features
+            )
+        else:
+            model, dense_layers, graph_inference = _load_keras_inference(
+                model_path, scaler_x_path, scaler_y_path, n_features
+            )
+        logger.info("Model artifacts loaded successfully.")
+
+        inference = _select_inference(dense_layers, graph_inference)
+        _warm_up(inference, n_features)
+        logger.debug("Model inference warmed up.")
 
-    return {"model": model, "scaler_X": scaler_X, "scaler_y": scaler_y, "meta": meta}
+        artifacts = {
+            "model": model,
+            "meta": meta,
+            "dense_layers": dense_layers,
+            "graph_inference": graph_inference,
+            # One batcher per loaded model, so concurrent predictions against it
+            # share inference calls. Coalesced batches stay small enough for
+            # the NumPy path; only a single large request goes to the graph.
+            "inference": InferenceBatcher(
+                inference, max_batch_rows=NUMPY_INFERENCE_MAX_ROWS
+            ),
+        }
+        with _ARTIFACT_CACHE_LOCK:
+            _ARTIFACT_CACHE[base_path] = (mtimes, artifacts)
+        return artifacts
@@ -1,11 +1,16 @@
+import asyncio
 import os
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 import tensorflow as tf
 
-from app.prediction.feature_engineering import extract_hotel_details_features
+from app.prediction.feature_engineering import (
+    binary_features,
+    extract_hotel_details_features,
+)
 from app.prediction.model_loader import load_model_artifacts
 from app.utils.constants import (
     get_model_filepath,
@@ -14,7 +19,74 @@ from app.utils.constants import (
 from app.utils.logger import logger
 
 
-async def predict_price(
+def _single_row_feature_matrix(
+    input_df: pd.DataFrame, feature_columns: List[str], binary_feature_columns: List[str]
+) -> np.ndarray:
+    """
+    Reads the features of a one-row frame straight into a (1, n) float32 matrix.
+
+    This is the scraped-target and manual-entry case, where casting whole
+    columns and consolidating the frame costs far more than the values themselves.
+    Missing features are 0, binary features are cast to int like the batch path.
+    """
+    binary = set(binary_feature_columns)
+    row = []
+    for col in feature_columns:
+        value = input_df[col].iat[0] if col in input_df.columns else 0
+        if col in binary:
+            value = int(value)
+        row.append(np.nan if value is None else value)
+    return np.fromiter(row, dtype=np.float32, count=len(row)).reshape(1, -1)
+
+
+def _left_join_features(
+    input_df: pd.DataFrame, features_df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Left-joins the hotel detail features onto the property rows by hotel link.
+
+    With one feature row per link and no clashing column names, which is the
+    usual case, the join is a single index lookup (`reindex`) plus a concat
+    rather than a hash merge. Otherwise it falls back to `pd.merge`, whose
+    row duplication and suffixing the result must then keep.
+    """
+    features = features_df.set_index("hotel_link")
+    if not features.index.is_unique or not features.columns.intersection(
+        input_df.columns
+    ).empty:
+        return pd.merge(input_df, features_df, on="hotel_link", how="left")
+
+    matched = features.reindex(input_df["hotel_link"].to_numpy())
+    return pd.concat(
+        [input_df.reset_index(drop=True), matched.reset_index(drop=True)], axis=1
+    )
+
+
+def _save_results(
+    results_df: pd.DataFrame,
+    model_type: str,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,
+    hotel_details_limit: int,
+) -> None:
+    """Saves prediction results to a timestamped CSV file under the predictions directory."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = get_prediction_filepath(
+        destination,
+        adults,
+        rooms,
+        limit,
+        hotel_details_limit,
+        model_type,
+        timestamp,
+    )
+    results_df.to_csv(filepath, index=False)
+    logger.info(f"Prediction results saved to {filepath}")
+
+
+def predict_price_sync(
     df_properties: pd.DataFrame,
     df_hotel_details: Optional[pd.DataFrame],
     model_type: str,
@@ -28,6 +100,8 @@ async def predict_price(
     """
     Loads a trained model and predicts prices for new input data.
 
+    This is the blocking implementation; async callers should use `predict_price`.
+
     Args:
         df_properties (pd.DataFrame): DataFrame containing property listing data.
         df_hotel_details (Optional[pd.DataFrame]): DataFrame containing detailed hotel data (for advanced model).
@@ -54,47 +128,69 @@ async def predict_price(
     )
 
     loaded_artifacts = load_model_artifacts(model_filename, model_type)
-    model = loaded_artifacts["model"]
-    scaler_X = loaded_artifacts["scaler_X"]
-    scaler_y = loaded_artifacts["scaler_y"]
     meta = loaded_artifacts["meta"]
 
     feature_columns = meta["features"]
+    binary_feature_columns = meta.get("binary_features")
+    if binary_feature_columns is None:  # Models trained before it was stored
+        binary_feature_columns = binary_features(feature_columns)
     currency = meta["currency"]
 
-    input_df = df_properties.copy()
+    # input_df is only ever rebound to new frames below, never modified in
+    # place, so the caller's frame can be used as is.
+    input_df = df_properties
     if model_type.lower() in ["advanced", "high"] and df_hotel_details is not None:
         advanced_features_df = extract_hotel_details_features(df_hotel_details)
-        input_df = pd.merge(input_df, advanced_features_df, on="hotel_link", how="left")
+        input_df = _left_join_features(input_df, advanced_features_df)
         if "hotel_link" not in df_properties.columns and len(df_properties) == 1:
-            input_df = (
-                df_properties.copy()
-            )  # Start with manual data which already has features mapped
-            # Ensure advanced features are added if they were in the training meta
-            for feature in advanced_features_df.columns:
-                if feature not in input_df.columns:
-                    input_df[feature] = (
-                        advanced_features_df[feature].iloc[0]
+            # Start with manual data which already has features mapped, and
+            # add the advanced features it lacks in a single assign.
+            added_features = [
+                feature
+                for feature in advanced_features_df.columns
+                if feature not in df_properties.columns
+            ]
+            input_df = df_properties.assign(
+                **{
+                    feature: (
+                        advanced_features_df[feature].iat[0]
                         if not advanced_features_df.empty
                         else 0
                     )
-
-    for col in feature_columns:
-        if col not in input_df.columns:
-            logger.warning(
-                f"Missing feature '{col}' in input data. Setting to 0 for prediction."
+                    for feature in added_features
+                }
             )
-            input_df[col] = 0
-
-    for col in feature_columns:
-        if "has_" in col or "preferred_badge" in col:  # Identify binary features
-            input_df[col] = input_df[col].astype(int)
 
-    X_predict = input_df[feature_columns].values
-    X_predict_scaled = scaler_X.transform(X_predict)
+    missing_features = [col for col in feature_columns if col not in input_df.columns]
+    for col in missing_features:
+        logger.warning(
+            f"Missing feature '{col}' in input data. Setting to 0 for prediction."
+        )
 
-    predictions_scaled = model.predict(X_predict_scaled)
-    predicted_prices = scaler_y.inverse_transform(predictions_scaled)
+    if len(input_df.index) == 1:
+        X_predict = _single_row_feature_matrix(
+            input_df, feature_columns, binary_feature_columns
+        )
+    else:
+        # Only the feature columns are selected, with the missing ones as 0, so
+        # the cast below never touches (or copies) the rest of the input.
+        features_df = input_df.reindex(columns=feature_columns, fill_value=0)
+        features_df[binary_feature_columns] = features_df[
+            binary_feature_columns
+        ].astype(int)
+
+        # One typed conversion straight to the float32 matrix the model works
+        # on, instead of an object array when the frame has object columns or a
+        # float64 copy the model would only convert again. The result is
+        # column-major, as pandas stores columns contiguously, and is used as
+        # is: the first layer's matrix product is no slower on that layout, so
+        # a C-order copy would only add a pass.
+        X_predict = features_df.to_numpy(dtype=np.float32)
+
+    # Goes through the model's batcher, which runs it together with any
+    # concurrent predictions and picks the NumPy or graph path by batch size;
+    # both map the raw features straight to prices.
+    predicted_prices = loaded_artifacts["inference"](X_predict)
 
     results_df = pd.DataFrame(predicted_prices, columns=["predicted_price"])
     results_df["currency"] = currency
@@ -105,18 +201,55 @@ async def predict_price(
         results_df["name"] = "Manually Entered Hotel"  # For single manual entry
 
     if save_results:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filepath = get_prediction_filepath(
+        _save_results(
+            results_df,
+            model_type,
             destination,
             adults,
             rooms,
             limit,
             hotel_details_limit,
-            model_type,
-            timestamp,
         )
-        results_df.to_csv(filepath, index=False)
-        logger.info(f"Prediction results saved to {filepath}")
 
     logger.info("Price prediction completed.")
     return results_df
+
+
+async def predict_price(
+    df_properties: pd.DataFrame,
+    df_hotel_details: Optional[pd.DataFrame],
+    model_type: str,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,  # properties_limit
+    hotel_details_limit: int,
+    save_results: bool = True,
+) -> pd.DataFrame:
+    """
+    Runs `predict_price_sync` in a worker thread.
+
+    Model loading and TensorFlow inference are CPU-bound, so they are kept off
+    the event loop to let concurrent scraping tasks (and the API server) keep
+    making progress. The results are saved in that thread too, before this
+    returns: a background save would be cancelled when a CLI run's event loop
+    shuts down.
+
+    Args:
+        Same as `predict_price_sync`.
+
+    Returns:
+        pd.DataFrame: DataFrame with predicted prices.
+    """
+    return await asyncio.to_thread(
+        predict_price_sync,
+        df_properties=df_properties,
+        df_hotel_details=df_hotel_details,
+        model_type=model_type,
+        destination=destination,
+        adults=adults,
+        rooms=rooms,
+        limit=limit,
+        hotel_details_limit=hotel_details_limit,
+        save_results=save_results,
+    )
@@ -0,0 +1,66 @@
+from typing import Any, List
+
+import tensorflow as tf
+
+from app.utils.logger import logger
+
+# Errors XLA raises when it cannot compile a model on this platform.
+_XLA_ERRORS = (
+    tf.errors.InvalidArgumentError,
+    tf.errors.UnimplementedError,
+    tf.errors.InternalError,
+)
+
+
+def fit_regressor(
+    model: Any,
+    train_ds: Any,
+    val_ds: Any,
+    epochs: int,
+    callbacks: List[Any],
+    learning_rate: float = 0.001,
+) -> Any:
+    """
+    Compiles a price regressor with XLA and trains it.
+
+    The networks are small enough that a training step is dominated by
+    dispatching its many small ops rather than by the matrix products. XLA
+    fuses the forward pass, MSE loss and Adam update into a few kernels, and
+    running a whole epoch's steps per execution leaves a single dispatch per
+    epoch. Keras only enables XLA by itself on accelerators, so it is requested
+    explicitly; where it cannot compile the model, training is redone without it.
+
+    Args:
+        model (Any): The uncompiled Keras model.
+        train_ds (Any): The batched training `tf.data.Dataset`.
+        val_ds (Any): The batched validation `tf.data.Dataset`.
+        epochs (int): The maximum number of epochs.
+        callbacks (List[Any]): The Keras callbacks, e.g. early stopping.
+        learning_rate (float): Adam's learning rate.
+
+    Returns:
+        Any: The Keras `History` of the training run.
+    """
+    steps_per_epoch = int(train_ds.cardinality())
+    for jit_compile in (True, False):
+        # MSE loss with MAE as a metric ('accuracy' is not suitable for regression)
+        model.compile(
+            optimizer=tf.keras.optimizers.Adam(learning_rate=learning_rate),
+            loss="mse",
+            metrics=["mae"],
+            jit_compile=jit_compile,
+            steps_per_execution=max(1, steps_per_epoch),
+        )
+        logger.info(f"Model compiled successfully (jit_compile={jit_compile}).")
+        try:
+            return model.fit(
+                train_ds,
+                validation_data=val_ds,
+                epochs=epochs,
+                callbacks=callbacks,
+                verbose=1,
+            )
+        except _XLA_ERRORS as e:
+            if not jit_compile:
+                raise
+            logger.warning(f"XLA could not compile the model, training without it: {e}")
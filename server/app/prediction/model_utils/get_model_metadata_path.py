@@ -1,6 +1,8 @@
 import os
+from functools import lru_cache
 
 
+@lru_cache(maxsize=256)
 def get_model_metadata_path(model_filename: str) -> str:
     """
     Constructs the file path for a model's metadata JSON file.
@@ -0,0 +1,104 @@
+from typing import Any, Tuple
+
+import numpy as np
+
+
+def _fitted_array(scaler: Any, attr: str, used: bool, default: float) -> np.ndarray:
+    """A fitted StandardScaler attribute as a float64 array, `default` if it is unused."""
+    value = getattr(scaler, attr, None)
+    # mean_ is still fitted with with_mean=False, but transform() ignores it.
+    if not used or value is None:
+        value = np.full(scaler.n_features_in_, default)
+    return np.asarray(value, dtype=np.float64)
+
+
+def scaler_params(scaler: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The affine transform of a fitted StandardScaler.
+
+    Args:
+        scaler (Any): A fitted `sklearn.preprocessing.StandardScaler`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The mean and the scale, as float64 arrays.
+    """
+    return (
+        _fitted_array(scaler, "mean_", scaler.with_mean, 0.0),
+        _fitted_array(scaler, "scale_", scaler.with_std, 1.0),
+    )
+
+
+def fit_scaler_params(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The mean and scale a StandardScaler would fit to `X`, computed with NumPy.
+
+    Training fits two scalers on arrays that are already numeric, where
+    sklearn's input validation and copies cost more than the statistics. As
+    in StandardScaler, the moments are accumulated in float64, and features
+    that are constant up to rounding get a scale of 1.
+
+    Args:
+        X (np.ndarray): The data, shape (n_samples, n_features).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The mean and the scale, as float64 arrays.
+    """
+    mean = X.mean(axis=0, dtype=np.float64)
+    var = X.var(axis=0, dtype=np.float64)
+    # StandardScaler's bound on the rounding error of the variance.
+    eps = np.finfo(np.float64).eps
+    n_samples = len(X)
+    constant = var <= n_samples * eps * var + (n_samples * mean * eps) ** 2
+    scale = np.sqrt(var)
+    scale[constant] = 1.0
+    return mean, scale
+
+
+def standardize(X: np.ndarray, mean: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """
+    Standardises `X` with the given mean and scale, as float32.
+
+    Args:
+        X (np.ndarray): The data, shape (n_samples, n_features).
+        mean (np.ndarray): The mean returned by `fit_scaler_params`.
+        scale (np.ndarray): The scale returned by `fit_scaler_params`.
+
+    Returns:
+        np.ndarray: The standardised data, as float32.
+    """
+    scaled = np.asarray(X, dtype=np.float32) - mean.astype(np.float32)
+    scaled /= scale.astype(np.float32)
+    return scaled
+
+
+def save_scaler_params(mean: np.ndarray, scale: np.ndarray, path: str) -> None:
+    """
+    Saves a scaler's mean and scale to a `.npz` file.
+
+    Inference only needs these two arrays, and reading them back is a plain
+    array load instead of unpickling and validating a sklearn object.
+
+    Args:
+        mean (np.ndarray): The mean subtracted by the scaler.
+        scale (np.ndarray): The scale divided by after subtracting the mean.
+        path (str): The `.npz` file to write.
+    """
+    np.savez(
+        path,
+        mean=np.asarray(mean, dtype=np.float64),
+        scale=np.asarray(scale, dtype=np.float64),
+    )
+
+
+def load_scaler_params(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Loads the mean and scale written by `save_scaler_params`.
+
+    Args:
+        path (str): The `.npz` file to read.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The mean and the scale, as float64 arrays.
+    """
+    with np.load(path) as params:
+        return params["mean"], params["scale"]
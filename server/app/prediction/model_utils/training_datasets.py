@@ -0,0 +1,80 @@
+from typing import Any, Tuple
+
+import numpy as np
+import tensorflow as tf
+
+# Datasets at least this large are trained on batches of 64 rather than 16.
+LARGE_BATCH_MIN_SAMPLES = 64
+
+
+def training_batch_size(num_samples: int) -> int:
+    """
+    The batch size to train on `num_samples` samples with.
+
+    Small datasets keep small batches, so an epoch still makes several
+    updates; larger ones use bigger batches, which spread each training step's
+    fixed overhead over more rows.
+
+    Args:
+        num_samples (int): The number of training samples.
+
+    Returns:
+        int: The batch size, at most `num_samples`.
+    """
+    if num_samples >= LARGE_BATCH_MIN_SAMPLES:
+        return min(64, num_samples)
+    return min(16, num_samples)
+
+
+def training_datasets(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+    batch_size: int,
+    seed: int = 42,
+) -> Tuple[Any, Any]:
+    """
+    Builds the `tf.data` input pipelines `model.fit` trains and validates on.
+
+    Given NumPy arrays, Keras re-slices and converts them into batches
+    synchronously every epoch. These pipelines convert the arrays to float32
+    once, cache them, and prefetch the next batch while the current step runs.
+    The training set is reshuffled every epoch, as `fit` does for arrays.
+
+    Args:
+        X_train (np.ndarray): The scaled training features.
+        y_train (np.ndarray): The scaled training targets.
+        X_val (np.ndarray): The scaled validation features.
+        y_val (np.ndarray): The scaled validation targets.
+        batch_size (int): The number of rows per batch.
+        seed (int): The shuffle seed.
+
+    Returns:
+        Tuple[Any, Any]: The training and the validation `tf.data.Dataset`.
+    """
+    train_ds = (
+        tf.data.Dataset.from_tensor_slices(
+            (
+                X_train.astype(np.float32, copy=False),
+                y_train.astype(np.float32, copy=False),
+            )
+        )
+        .cache()
+        .shuffle(len(X_train), seed=seed, reshuffle_each_iteration=True)
+        .batch(batch_size)
+        .prefetch(tf.data.AUTOTUNE)
+    )
+    # The validation batches never change, so they are cached once assembled.
+    val_ds = (
+        tf.data.Dataset.from_tensor_slices(
+            (
+                X_val.astype(np.float32, copy=False),
+                y_val.astype(np.float32, copy=False),
+            )
+        )
+        .batch(batch_size)
+        .cache()
+        .prefetch(tf.data.AUTOTUNE)
+    )
+    return train_ds, val_ds
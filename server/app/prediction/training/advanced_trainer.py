@@ -1,18 +1,37 @@
+import asyncio
+import json
 import os
 from typing import cast
 
-import joblib
+import numpy as np
 import pandas as pd
 import tensorflow as tf
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 
-from app.prediction.feature_engineering import extract_hotel_details_features
-from app.utils.constants import ML_MODEL_DIR, get_model_filepath
+from app.prediction.calculation.graph_inference import save_inference_model
+from app.prediction.feature_engineering import (
+    binary_features,
+    extract_hotel_details_features,
+)
+from app.prediction.model_utils.fit_regressor import fit_regressor
+from app.prediction.model_utils.scaler_params import (
+    fit_scaler_params,
+    save_scaler_params,
+    standardize,
+)
+from app.prediction.model_utils.training_datasets import (
+    training_batch_size,
+    training_datasets,
+)
+from app.utils.constants import (
+    ML_MODEL_DIR,
+    SAVED_MODEL_DIRNAME,
+    get_model_filepath,
+)
 from app.utils.logger import logger
 
 
-async def train_advanced_model(
+def train_advanced_model_sync(
     df_properties: pd.DataFrame,
     df_hotel_details: pd.DataFrame,
     destination: str,
@@ -118,7 +137,9 @@ async def train_advanced_model(
                 f"Insufficient valid data after cleaning: only {len(df_merged)} properties remain. Need at least 10."
             )
 
-        X = df_merged[feature_columns].values
+        # Typed straight to float32, the precision the model trains in, rather
+        # than an object or float64 array the scaler and Keras would convert.
+        X = df_merged[feature_columns].to_numpy(dtype=np.float32)
         y = df_merged[target_column]
 
         logger.info(f"Training advanced model with {len(X)} properties.")
@@ -147,16 +168,21 @@ async def train_advanced_model(
 
         # Scale features
         logger.info("Scaling features for advanced model.")
-        scaler_X = StandardScaler()
-        X_train_scaled = scaler_X.fit_transform(X_train)
-        X_test_scaled = scaler_X.transform(X_test)
+        # Fitted with NumPy: the data is already a numeric array, so sklearn's
+        # StandardScaler would only add input validation and copies.
+        x_mean, x_scale = fit_scaler_params(X_train)
+        X_train_scaled = standardize(X_train, x_mean, x_scale)
+        X_test_scaled = standardize(X_test, x_mean, x_scale)
         logger.debug("Features scaled.")
 
         # Scale target
         logger.info("Scaling target variable for advanced model.")
-        scaler_y = StandardScaler()
-        y_train_scaled = scaler_y.fit_transform(y_train.values.reshape(-1, 1))
-        y_test_scaled = scaler_y.transform(y_test.values.reshape(-1, 1))
+        y_train_2d = y_train.to_numpy(dtype=np.float64).reshape(-1, 1)
+        y_mean, y_scale = fit_scaler_params(y_train_2d)
+        y_train_scaled = standardize(y_train_2d, y_mean, y_scale)
+        y_test_scaled = standardize(
+            y_test.to_numpy(dtype=np.float64).reshape(-1, 1), y_mean, y_scale
+        )
         logger.debug("Target variable scaled.")
 
         logger.info("Building TensorFlow Keras model for advanced prediction.")
@@ -191,13 +217,6 @@ async def train_advanced_model(
             ]
         )
 
-        model.compile(
-            optimizer=tf.keras.optimizers.Adam(learning_rate=0.001),
-            loss="mse",
-            metrics=["mae"],
-        )
-        logger.info("Advanced model compiled successfully.")
-
         patience = max(
             10,
             min(25, num_samples // 3),  # Slightly more patience for advanced model
@@ -219,14 +238,15 @@ async def train_advanced_model(
             f"Training for up to {epochs} epochs (early stopping may end training sooner)"
         )
 
-        history = model.fit(
+        train_ds, val_ds = training_datasets(
             X_train_scaled,
             y_train_scaled,
-            validation_data=(X_test_scaled, y_test_scaled),
-            epochs=epochs,
-            batch_size=min(16, len(X_train)),
-            callbacks=[early_stopping],
-            verbose=1,
+            X_test_scaled,
+            y_test_scaled,
+            batch_size=training_batch_size(len(X_train)),
+        )
+        history = fit_regressor(
+            model, train_ds, val_ds, epochs=epochs, callbacks=[early_stopping]
         )
         logger.info(f"Advanced model training completed.")
 
@@ -251,22 +271,42 @@ async def train_advanced_model(
         model.save(os.path.join(base_path, "tf_model.keras"))
         logger.debug("Advanced TensorFlow model saved.")
 
-        joblib.dump(
-            scaler_X, os.path.join(base_path, f"{model_name_prefix}_scaler_X.joblib")
+        save_scaler_params(
+            x_mean,
+            x_scale,
+            os.path.join(base_path, f"{model_name_prefix}_scaler_X.npz"),
         )
-        joblib.dump(
-            scaler_y, os.path.join(base_path, f"{model_name_prefix}_scaler_y.joblib")
+        save_scaler_params(
+            y_mean,
+            y_scale,
+            os.path.join(base_path, f"{model_name_prefix}_scaler_y.npz"),
         )
         logger.debug("Advanced scalers saved.")
 
-        joblib.dump(
-            {
-                "features": feature_columns,  # Use dynamically generated feature_columns
-                "target": target_column,
-                "currency": currency,
-            },
-            os.path.join(base_path, f"{model_name_prefix}_meta.joblib"),
+        # The scaled model as one serving graph, which loads faster than
+        # rebuilding the Keras model and refitting the scaling around it.
+        save_inference_model(
+            model,
+            os.path.join(base_path, SAVED_MODEL_DIRNAME),
+            X_train_scaled.shape[1],
+            x_mean,
+            x_scale,
+            y_mean,
+            y_scale,
         )
+        logger.debug("Advanced SavedModel exported.")
+
+        with open(os.path.join(base_path, f"{model_name_prefix}_meta.json"), "w") as f:
+            json.dump(
+                {
+                    "features": feature_columns,  # Use dynamically generated feature_columns
+                    "binary_features": binary_features(feature_columns),
+                    "target": target_column,
+                    "currency": currency,
+                },
+                f,
+                indent=4,
+            )
         logger.debug("Advanced metadata saved.")
 
         logger.info("Advanced price predictor created and saved successfully.")
@@ -278,3 +318,28 @@ async def train_advanced_model(
             exc_info=True,
         )
         raise Exception(f"Error creating advanced price predictor: {str(e)}")
+
+
+async def train_advanced_model(
+    df_properties: pd.DataFrame,
+    df_hotel_details: pd.DataFrame,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,
+) -> None:
+    """
+    Runs `train_advanced_model_sync` in a worker thread.
+
+    Fitting the network is CPU-bound and takes far longer than a request, so
+    it is kept off the event loop, like prediction in `predict_price`.
+    """
+    return await asyncio.to_thread(
+        train_advanced_model_sync,
+        df_properties,
+        df_hotel_details,
+        destination,
+        adults,
+        rooms,
+        limit,
+    )
@@ -1,205 +1,607 @@
+import asyncio
+import glob
+import hashlib
+import json
 import os
-from typing import cast
+import shutil
+from typing import List
 
-import joblib
+import numpy as np
 import pandas as pd
-import tensorflow as tf
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 
+# TensorFlow, scikit-learn and joblib are imported where they are used: this
+# module is imported by the scraping orchestrator, which only trains a model
+# now and then, and importing TensorFlow alone takes seconds.
+from app.prediction.model_utils.scaler_params import (
+    fit_scaler_params,
+    save_scaler_params,
+    standardize,
+)
+from app.utils.constants import (
+    SAVED_MODEL_DIRNAME,
+    SKLEARN_MODEL_FILENAME,
+    TRAINING_CACHE_DIR,
+)
 from app.utils.logger import logger
 
 
-async def train_model(
-    properties_df: pd.DataFrame,
-    hotel_details_df: pd.DataFrame,
-    destination: str,
-    adults: int,
-    rooms: int,
-    limit: int,  # This is properties_limit
-    hotel_details_limit: int,
-    model_filename: str,  # New parameter for the full model filename
-) -> str:  # Return model_filename
-    logger.info(
-        f"Starting price predictor training for model: '{model_filename}' for destination='{destination}', "
-        f"adults={adults}, rooms={rooms}, properties_limit={limit}, hotel_details_limit={hotel_details_limit}."
+# The input columns the training frame is built from; only these can change it.
+_TRAINING_PROPERTY_COLUMNS = [
+    "hotel_link",
+    "star_rating",
+    "guest_rating_score",
+    "reviews",
+    "distance_from_downtown",
+    "distance_from_beach",
+    "preferred_badge",
+    "discounted_price_value",
+    "discounted_price_currency",
+]
+_TRAINING_DETAIL_COLUMNS = ["url", "star_rating", "guest_rating", "review_count"]
+
+# The columns of each frame the URL join carries into the training frame.
+_MERGED_PROPERTY_COLUMNS = [
+    "hotel_link_normalized",
+    "star_rating",
+    "guest_rating_score",
+    "reviews",
+    "distance_from_downtown",
+    "distance_from_beach",
+    "preferred_badge",
+    "discounted_price_value",
+    "discounted_price_currency",
+]
+_MERGED_DETAIL_COLUMNS = [
+    "url_normalized",
+    "detail_star_rating",
+    "detail_guest_rating",
+    "detail_review_count",
+]
+
+# Below this many training samples, gradient boosted trees are trained instead
+# of the Keras network.
+SKLEARN_MAX_TRAIN_SAMPLES = 200
+
+# The basic model's features, in the order of its input columns.
+BASIC_FEATURE_COLUMNS = [
+    "star_rating",
+    "guest_rating_score",
+    "reviews",
+    "distance_from_downtown",
+    "distance_from_beach",
+    "preferred_badge",
+]
+
+
+def _normalize_booking_urls(urls: pd.Series) -> pd.Series:
+    """
+    Each URL without its query string and surrounding whitespace, "" for non-strings.
+
+    String-dtype columns, which scraped and loaded data have, are normalized
+    with the vectorized string methods. Other columns may mix in non-string
+    values, so they go through one list comprehension instead of a per-row
+    `apply` call.
+    """
+    if isinstance(urls.dtype, pd.StringDtype):
+        return urls.str.replace(r"(?s)\?.*", "", regex=True).str.strip().fillna("")
+    return pd.Series(
+        [url.split("?")[0].strip() if isinstance(url, str) else "" for url in urls],
+        index=urls.index,
     )
 
-    try:
-        # Merge properties and hotel details for comprehensive training data
-        initial_properties_count = len(properties_df)
-        initial_hotel_details_count = len(hotel_details_df)
-
-        # Normalize URLs for consistent merging
-        def normalize_booking_url(url: str) -> str:
-            if not isinstance(url, str):
-                return ""  # Return empty string for non-string types to avoid errors
-            return url.split("?")[0].strip()
-
-        properties_df["hotel_link_normalized"] = properties_df["hotel_link"].apply(
-            normalize_booking_url
+
+def _prepare_training_frame(
+    properties_df: pd.DataFrame, hotel_details_df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Joins the property listings with their hotel details and cleans the result.
+
+    Returns:
+        pd.DataFrame: The basic model's features, the price and its currency,
+            one row per usable property.
+
+    Raises:
+        Exception: If too few properties are left for training.
+    """
+    # Merge properties and hotel details for comprehensive training data
+    initial_properties_count = len(properties_df)
+    initial_hotel_details_count = len(hotel_details_df)
+
+    # Normalize URLs for consistent merging
+    properties_df["hotel_link_normalized"] = _normalize_booking_urls(
+        properties_df["hotel_link"]
+    )
+    hotel_details_df["url_normalized"] = _normalize_booking_urls(
+        hotel_details_df["url"]
+    )
+
+    # Rename conflicting columns in hotel_details_df before merge to avoid _x, _y suffixes
+    hotel_details_df_renamed = hotel_details_df.rename(
+        columns={
+            "name": "detail_name",
+            "star_rating": "detail_star_rating",
+            "address": "detail_address",
+            "guest_rating": "detail_guest_rating",
+            "review_count": "detail_review_count",
+        }
+    )
+
+    # Debugging logs before merge
+    logger.debug(f"Properties DF count before merge: {len(properties_df)}")
+    logger.debug(
+        f"Hotel Details DF count before merge: {len(hotel_details_df_renamed)}"
+    )
+
+    # Samples are only built if a sink accepts debug records.
+    if not properties_df.empty:
+        logger.opt(lazy=True).debug(
+            "Properties DF 'hotel_link_normalized' sample (first 5): {}",
+            lambda: properties_df["hotel_link_normalized"].head().tolist(),
         )
-        hotel_details_df["url_normalized"] = hotel_details_df["url"].apply(
-            normalize_booking_url
+    if not hotel_details_df_renamed.empty:
+        logger.opt(lazy=True).debug(
+            "Hotel Details DF 'url_normalized' sample (first 5): {}",
+            lambda: hotel_details_df_renamed["url_normalized"].head().tolist(),
         )
 
-        # Rename conflicting columns in hotel_details_df before merge to avoid _x, _y suffixes
-        hotel_details_df_renamed = hotel_details_df.rename(
-            columns={
-                "name": "detail_name",
-                "star_rating": "detail_star_rating",
-                "address": "detail_address",
-                "guest_rating": "detail_guest_rating",
-                "review_count": "detail_review_count",
-            }
+    if not properties_df.empty and not hotel_details_df_renamed.empty:
+        # Set differences of pandas indexes, hashed natively, rather than of
+        # Python sets built from every unique URL.
+        properties_links = pd.Index(
+            properties_df["hotel_link_normalized"].dropna().unique()
         )
-
-        # Debugging logs before merge
-        logger.debug(f"Properties DF count before merge: {len(properties_df)}")
-        logger.debug(
-            f"Hotel Details DF count before merge: {len(hotel_details_df_renamed)}"
+        hotel_details_urls = pd.Index(
+            hotel_details_df_renamed["url_normalized"].dropna().unique()
         )
 
-        if not properties_df.empty:
-            logger.debug(
-                f"Properties DF 'hotel_link_normalized' sample (first 5): {properties_df['hotel_link_normalized'].head().tolist()}"
-            )
-        if not hotel_details_df_renamed.empty:
-            logger.debug(
-                f"Hotel Details DF 'url_normalized' sample (first 5): {hotel_details_df_renamed['url_normalized'].head().tolist()}"
-            )
+        missing_in_hotel_details = properties_links.difference(
+            hotel_details_urls, sort=False
+        )
+        missing_in_properties = hotel_details_urls.difference(
+            properties_links, sort=False
+        )
 
-        if not properties_df.empty and not hotel_details_df_renamed.empty:
-            properties_links = set(
-                properties_df["hotel_link_normalized"].dropna().unique()
+        if len(missing_in_hotel_details):
+            logger.warning(
+                f"Hotel links in properties_df not found in hotel_details_df (normalized): {len(missing_in_hotel_details)} items. Sample: {list(missing_in_hotel_details[:5])}"
             )
-            hotel_details_urls = set(
-                hotel_details_df_renamed["url_normalized"].dropna().unique()
+        if len(missing_in_properties):
+            logger.warning(
+                f"Hotel URLs in hotel_details_df not found in properties_df (normalized): {len(missing_in_properties)} items. Sample: {list(missing_in_properties[:5])}"
             )
 
-            missing_in_hotel_details = properties_links - hotel_details_urls
-            missing_in_properties = hotel_details_urls - properties_links
+    # Only the join keys and the columns the training frame is built from are
+    # merged, rather than every scraped column of both frames. The detail
+    # columns are optional: missing ones are simply not used to fill gaps.
+    detail_columns = [
+        column
+        for column in _MERGED_DETAIL_COLUMNS
+        if column in hotel_details_df_renamed.columns
+    ]
+
+    # pandas already factorizes string keys into integer codes inside the
+    # merge, so merging on pre-factorized codes would only hash them twice.
+    df = pd.merge(
+        properties_df[_MERGED_PROPERTY_COLUMNS],
+        hotel_details_df_renamed[detail_columns],  # Use the renamed DataFrame
+        left_on="hotel_link_normalized",
+        right_on="url_normalized",
+        how="inner",
+    )
 
-            if missing_in_hotel_details:
-                logger.warning(
-                    f"Hotel links in properties_df not found in hotel_details_df (normalized): {len(missing_in_hotel_details)} items. Sample: {list(missing_in_hotel_details)[:5]}"
-                )
-            if missing_in_properties:
-                logger.warning(
-                    f"Hotel URLs in hotel_details_df not found in properties_df (normalized): {len(missing_in_properties)} items. Sample: {list(missing_in_properties)[:5]}"
-                )
+    logger.info(
+        f"Merged {initial_properties_count} properties and {initial_hotel_details_count} hotel details. "
+        f"Resulting training dataset has {len(df)} entries after inner join."
+    )
 
-        df = pd.merge(
-            properties_df,
-            hotel_details_df_renamed,  # Use the renamed DataFrame
-            left_on="hotel_link_normalized",
-            right_on="url_normalized",
-            how="inner",
+    if len(df) < 10:  # Minimum data requirement after merge
+        logger.warning(
+            f"Insufficient data after merge: only {len(df)} properties found. Need at least 10 for training."
+        )
+        raise Exception(
+            f"Insufficient data after merge: only {len(df)} properties found. Need at least 10 for training."
         )
 
-        logger.info(
-            f"Merged {initial_properties_count} properties and {initial_hotel_details_count} hotel details. "
-            f"Resulting training dataset has {len(df)} entries after inner join."
+    def coalesce(column: str, detail_column: str) -> pd.Series:
+        # Missing property values are filled from the hotel details
+        if detail_column not in df.columns:
+            return df[column]
+        return df[column].fillna(df[detail_column])
+
+    # Every training column is converted to a float32 array once, and the
+    # rows missing any of them are found with one NaN mask over those arrays,
+    # instead of assembling a frame, dropping its incomplete rows and then
+    # converting the remaining columns again. Non-numeric values count as
+    # missing.
+    columns = {
+        "star_rating": coalesce("star_rating", "detail_star_rating"),
+        "guest_rating_score": coalesce("guest_rating_score", "detail_guest_rating"),
+        "reviews": coalesce("reviews", "detail_review_count"),
+        "distance_from_downtown": df["distance_from_downtown"],
+        "distance_from_beach": df["distance_from_beach"],
+        "preferred_badge": df["preferred_badge"],
+        # A missing price is treated as 0 rather than dropping the row.
+        "discounted_price_value": pd.to_numeric(
+            df["discounted_price_value"], errors="coerce"
+        ).fillna(0),
+    }
+    arrays = {
+        name: pd.to_numeric(values, errors="coerce").to_numpy(
+            dtype=np.float32, na_value=np.nan
         )
+        for name, values in columns.items()
+    }
+    complete = np.logical_and.reduce(
+        [~np.isnan(values) for values in arrays.values()]
+    )
+    logger.info(
+        f"Dropped {len(complete) - int(complete.sum())} rows with missing values. "
+        f"Remaining properties: {int(complete.sum())}"
+    )
 
-        # Fill missing values in properties_df columns using data from hotel_details_df
-        # Prioritize detailed information where available
-        if "detail_star_rating" in df.columns:
-            df["star_rating"] = df["star_rating"].fillna(df["detail_star_rating"])
-        if "detail_guest_rating" in df.columns:
-            df["guest_rating_score"] = df["guest_rating_score"].fillna(
-                df["detail_guest_rating"]
-            )
-        if "detail_review_count" in df.columns:
-            df["reviews"] = df["reviews"].fillna(df["detail_review_count"])
-
-        # Drop the temporary detail_ columns
-        df.drop(
-            columns=[
-                col
-                for col in [
-                    "detail_name",
-                    "detail_star_rating",
-                    "detail_address",
-                    "detail_guest_rating",
-                    "detail_review_count",
-                ]
-                if col in df.columns
-            ],
-            inplace=True,
+    currency = df["discounted_price_currency"].to_numpy()
+    df = pd.DataFrame({name: values[complete] for name, values in arrays.items()})
+    df["discounted_price_currency"] = currency[complete]
+    logger.debug(f"DataFrame head after column selection:\n{df.head()}")
+
+    # Check if we still have enough data after cleaning
+    if len(df) < 10:
+        logger.warning(
+            f"Insufficient valid data after cleaning: only {len(df)} properties remain. Need at least 10."
+        )
+        raise Exception(
+            f"Insufficient valid data after cleaning: only {len(df)} properties remain. Need at least 10."
         )
 
-        if len(df) < 10:  # Minimum data requirement after merge
-            logger.warning(
-                f"Insufficient data after merge: only {len(df)} properties found. Need at least 10 for training."
-            )
-            raise Exception(
-                f"Insufficient data after merge: only {len(df)} properties found. Need at least 10 for training."
+    return df
+
+
+def _training_frame_cache_path(
+    properties_df: pd.DataFrame,
+    hotel_details_df: pd.DataFrame,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,
+    hotel_details_limit: int,
+) -> str:
+    """
+    The cache file of the training frame prepared from exactly these inputs.
+
+    The file is named `train_<params>_<content>.parquet`: the first hash keys
+    the model parameters, the second the values of every input column the
+    preparation reads, so changed scraped data never hits the entry of an
+    earlier scrape.
+    """
+    params_key = hashlib.sha1(
+        f"{destination}|{adults}|{rooms}|{limit}|{hotel_details_limit}".encode()
+    ).hexdigest()[:16]
+    digest = hashlib.sha1()
+    for df, columns in (
+        (properties_df, _TRAINING_PROPERTY_COLUMNS),
+        (hotel_details_df, _TRAINING_DETAIL_COLUMNS),
+    ):
+        present = [col for col in columns if col in df.columns]
+        digest.update("|".join(present).encode())
+        if present:
+            digest.update(
+                pd.util.hash_pandas_object(df[present], index=False)
+                .to_numpy()
+                .tobytes()
             )
+    return os.path.join(
+        TRAINING_CACHE_DIR, f"train_{params_key}_{digest.hexdigest()[:16]}.parquet"
+    )
 
-        # Fixed: Removed duplicate and added distance_from_beach
-        df = cast(
-            pd.DataFrame,
-            df[
-                [
-                    "star_rating",  # Changed from "star_rating"
-                    "guest_rating_score",
-                    "reviews",
-                    "distance_from_downtown",
-                    "distance_from_beach",
-                    "preferred_badge",
-                    "discounted_price_value",
-                    "discounted_price_currency",
-                ]
-            ].copy(),
+
+def _remove_stale_training_caches(cache_path: str) -> None:
+    """
+    Deletes the cached frames of earlier scrapes for `cache_path`'s parameters.
+
+    Only the entry for the latest data of a model configuration can be hit
+    again, so keeping one per configuration bounds the cache directory.
+    """
+    params_prefix = os.path.basename(cache_path).rsplit("_", 1)[0]
+    for stale_path in glob.glob(
+        os.path.join(TRAINING_CACHE_DIR, f"{params_prefix}_*.parquet")
+    ):
+        if stale_path == cache_path:
+            continue
+        try:
+            os.remove(stale_path)
+            logger.debug(f"Removed stale training data cache {stale_path}")
+        except OSError as e:
+            logger.warning(f"Failed to remove training data cache {stale_path}: {e}")
+
+
+def _load_or_prepare_training_frame(
+    properties_df: pd.DataFrame,
+    hotel_details_df: pd.DataFrame,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,
+    hotel_details_limit: int,
+) -> pd.DataFrame:
+    """
+    `_prepare_training_frame`, reusing the frame cached for identical inputs.
+
+    Retraining on unchanged data (e.g. once a model is stale) then skips the
+    join and cleaning. The cache is a Parquet file, so it is only used when
+    pyarrow is installed.
+    """
+    try:
+        cache_path = _training_frame_cache_path(
+            properties_df,
+            hotel_details_df,
+            destination,
+            adults,
+            rooms,
+            limit,
+            hotel_details_limit,
         )
+    except TypeError as e:  # Unhashable values, e.g. lists in an input column
+        logger.debug(f"Training frame not cacheable: {e}")
+        return _prepare_training_frame(properties_df, hotel_details_df)
+
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_parquet(cache_path)
+            logger.info(f"Reusing prepared training data from {cache_path}")
+            return df
+        except Exception as e:
+            logger.warning(f"Failed to read training data cache {cache_path}: {e}")
+
+    df = _prepare_training_frame(properties_df, hotel_details_df)
+    try:
+        os.makedirs(TRAINING_CACHE_DIR, exist_ok=True)
+        df.to_parquet(cache_path, index=False, compression="zstd")
+        logger.debug(f"Cached prepared training data to {cache_path}")
+        _remove_stale_training_caches(cache_path)
+    except ImportError:
+        logger.debug("pyarrow is not installed, not caching the training data.")
+    except Exception as e:
+        logger.warning(f"Failed to cache training data to {cache_path}: {e}")
+    return df
+
+
+def _train_keras_model(
+    X_train: np.ndarray,
+    X_test: np.ndarray,
+    y_train: pd.Series,
+    y_test: pd.Series,
+    model_dir: str,
+    model_base_name: str,
+) -> None:
+    """
+    Trains the Keras price network and saves it, its scalers and its SavedModel.
+
+    Args:
+        X_train (np.ndarray): The training features.
+        X_test (np.ndarray): The validation features.
+        y_train (pd.Series): The training prices.
+        y_test (pd.Series): The validation prices.
+        model_dir (str): The directory to save the artifacts to.
+        model_base_name (str): The prefix of the scaler files.
+    """
+    # Silences TensorFlow's C++ start-up logging, unless configured otherwise.
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+    import tensorflow as tf
+
+    from app.prediction.calculation.graph_inference import save_inference_model
+    from app.prediction.model_utils.fit_regressor import fit_regressor
+    from app.prediction.model_utils.training_datasets import (
+        training_batch_size,
+        training_datasets,
+    )
+
+    num_samples = len(X_train)
+
+    # Scale features
+    logger.info("Scaling features.")
+    # Fitted with NumPy: the data is already a numeric array, so sklearn's
+    # StandardScaler would only add input validation and copies.
+    x_mean, x_scale = fit_scaler_params(X_train)
+    X_train_scaled = standardize(X_train, x_mean, x_scale)
+    X_test_scaled = standardize(X_test, x_mean, x_scale)
+    logger.debug("Features scaled.")
+
+    # Scale target - CRITICAL FIX: Reshape to 2D array
+    logger.info("Scaling target variable.")
+    y_train_2d = y_train.to_numpy(dtype=np.float64).reshape(-1, 1)
+    y_mean, y_scale = fit_scaler_params(y_train_2d)
+    y_train_scaled = standardize(y_train_2d, y_mean, y_scale)
+    y_test_scaled = standardize(
+        y_test.to_numpy(dtype=np.float64).reshape(-1, 1), y_mean, y_scale
+    )
+    logger.debug("Target variable scaled.")
+
+    logger.info("Building TensorFlow Keras model.")
+
+    # Scale model complexity with data size
+    # Small datasets (< 30): simpler model
+    # Medium datasets (30-100): moderate complexity
+    # Large datasets (> 100): full complexity
+    if num_samples < 30:
+        first_layer = min(32, num_samples * 2)
+        second_layer = min(16, num_samples)
+        dropout_rate = 0.2
+    elif num_samples < 100:
+        first_layer = 64
+        second_layer = 32
+        dropout_rate = 0.3
+    else:
+        first_layer = 128
+        second_layer = 64
+        dropout_rate = 0.4
+
+    logger.info(
+        f"Dynamic model architecture: [{first_layer}, {second_layer}] "
+        f"with dropout={dropout_rate} for {num_samples} training samples"
+    )
 
-        logger.debug(f"DataFrame head after column selection:\n{df.head()}")
-
-        df["discounted_price_value"] = pd.to_numeric(
-            df["discounted_price_value"],
-            errors="coerce",
-        ).fillna(0)
-        logger.debug("Converted 'discounted_price' to numeric and filled NaNs.")
-
-        # Fixed: Updated required_cols to match actual columns
-        required_cols = [
-            "star_rating",  # Changed from "star_rating"
-            "guest_rating_score",
-            "reviews",
-            "distance_from_downtown",
-            "distance_from_beach",
-            "preferred_badge",
-            "discounted_price_value",
+    model = tf.keras.Sequential(
+        [
+            tf.keras.layers.Dense(first_layer, activation="relu"),
+            tf.keras.layers.Dropout(dropout_rate),
+            tf.keras.layers.Dense(second_layer, activation="relu"),
+            tf.keras.layers.Dropout(dropout_rate),
+            tf.keras.layers.Dense(1),
         ]
+    )
 
-        initial_rows = len(df)
-        df.dropna(subset=required_cols, inplace=True)
-        logger.info(
-            f"Dropped {initial_rows - len(df)} rows with missing values. "
-            f"Remaining properties: {len(df)}"
-        )
+    # Add early stopping with dynamic patience based on dataset size
+    # Smaller datasets need more patience as they're more volatile
+    patience = max(10, min(20, num_samples // 3))
+    early_stopping = tf.keras.callbacks.EarlyStopping(
+        monitor="val_loss", patience=patience, restore_best_weights=True
+    )
+    logger.info(f"Early stopping callback added with patience={patience}.")
 
-        # Check if we still have enough data after cleaning
-        if len(df) < 10:
-            logger.warning(
-                f"Insufficient valid data after cleaning: only {len(df)} properties remain. Need at least 10."
-            )
-            raise Exception(
-                f"Insufficient valid data after cleaning: only {len(df)} properties remain. Need at least 10."
-            )
+    logger.info("Starting model training.")
 
-        # Fixed: Updated feature selection to include distance_from_beach
-        X = df[
-            [
-                "star_rating",  # Changed from "star_rating"
-                "guest_rating_score",
-                "reviews",
-                "distance_from_downtown",
-                "distance_from_beach",
-                "preferred_badge",
-            ]
-        ].values
+    # Dynamic epochs based on dataset size
+    # Smaller datasets need more epochs to learn patterns
+    if num_samples < 30:
+        epochs = 100
+    elif num_samples < 100:
+        epochs = 50
+    else:
+        epochs = 30
+
+    logger.info(
+        f"Training for up to {epochs} epochs (early stopping may end training sooner)"
+    )
+
+    train_ds, val_ds = training_datasets(
+        X_train_scaled,
+        y_train_scaled,
+        X_test_scaled,
+        y_test_scaled,
+        batch_size=training_batch_size(len(X_train)),
+    )
+    history = fit_regressor(
+        model, train_ds, val_ds, epochs=epochs, callbacks=[early_stopping]
+    )
+    logger.info("Model training completed.")
+
+    logger.info(f"Final training loss: {history.history['loss'][-1]:.4f}")
+    logger.info(f"Final validation loss: {history.history['val_loss'][-1]:.4f}")
+
+    model.save(os.path.join(model_dir, "tf_model.keras"))
+    logger.debug("TensorFlow model saved.")
+
+    # Save BOTH scalers
+    save_scaler_params(
+        x_mean, x_scale, os.path.join(model_dir, f"{model_base_name}_scaler_X.npz")
+    )
+    save_scaler_params(
+        y_mean, y_scale, os.path.join(model_dir, f"{model_base_name}_scaler_y.npz")
+    )
+    logger.debug("Scalers saved.")
+
+    # The scaled model as one serving graph, which loads faster than
+    # rebuilding the Keras model and refitting the scaling around it.
+    save_inference_model(
+        model,
+        os.path.join(model_dir, SAVED_MODEL_DIRNAME),
+        X_train_scaled.shape[1],
+        x_mean,
+        x_scale,
+        y_mean,
+        y_scale,
+    )
+    logger.debug("SavedModel exported.")
+
+
+def _train_gradient_boosting(
+    X_train: np.ndarray,
+    X_test: np.ndarray,
+    y_train: pd.Series,
+    y_test: pd.Series,
+    model_dir: str,
+) -> None:
+    """
+    Trains a gradient boosted tree regressor and saves it with joblib.
+
+    Used instead of the network for small datasets, where it fits in tens of
+    milliseconds instead of many Keras epochs and is usually at least as
+    accurate. Trees need no feature or target scaling, so the model maps raw
+    features straight to prices.
+
+    Args:
+        X_train (np.ndarray): The training features.
+        X_test (np.ndarray): The validation features, used for early stopping.
+        y_train (pd.Series): The training prices.
+        y_test (pd.Series): The validation prices.
+        model_dir (str): The directory to save the model to.
+    """
+    import joblib
+    from sklearn.ensemble import HistGradientBoostingRegressor
+
+    num_samples = len(X_train)
+    # The default of 20 samples per leaf would leave the trees of the smallest
+    # datasets without a single split.
+    min_samples_leaf = max(2, min(20, num_samples // 10))
+    logger.info(
+        f"Training gradient boosted trees with min_samples_leaf={min_samples_leaf} "
+        f"for {num_samples} training samples"
+    )
+    model = HistGradientBoostingRegressor(
+        max_iter=200,
+        min_samples_leaf=min_samples_leaf,
+        early_stopping=True,
+        random_state=42,
+    )
+    model.fit(X_train, y_train.to_numpy(), X_val=X_test, y_val=y_test.to_numpy())
+    logger.info(f"Model training completed after {model.n_iter_} iterations.")
+
+    validation_mse = float(np.mean((model.predict(X_test) - y_test.to_numpy()) ** 2))
+    logger.info(f"Final validation MSE: {validation_mse:.4f}")
+
+    joblib.dump(model, os.path.join(model_dir, SKLEARN_MODEL_FILENAME))
+    logger.debug("Gradient boosting model saved.")
+
+
+def _remove_artifacts(model_dir: str, names: List[str]) -> None:
+    """Deletes the files or directories `names` in `model_dir`, where they exist."""
+    for name in names:
+        path = os.path.join(model_dir, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path):
+            os.remove(path)
+
+
+def train_model_sync(
+    properties_df: pd.DataFrame,
+    hotel_details_df: pd.DataFrame,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,  # This is properties_limit
+    hotel_details_limit: int,
+    model_filename: str,  # New parameter for the full model filename
+) -> str:  # Return model_filename
+    logger.info(
+        f"Starting price predictor training for model: '{model_filename}' for destination='{destination}', "
+        f"adults={adults}, rooms={rooms}, properties_limit={limit}, hotel_details_limit={hotel_details_limit}."
+    )
+
+    try:
+        df = _load_or_prepare_training_frame(
+            properties_df,
+            hotel_details_df,
+            destination,
+            adults,
+            rooms,
+            limit,
+            hotel_details_limit,
+        )
+
+        # One typed conversion to the float32 matrix Keras trains on, so the
+        # scaler and the model do not each convert an object or float64 copy.
+        X = df[BASIC_FEATURE_COLUMNS].to_numpy(dtype=np.float32)
         y = df["discounted_price_value"]
 
         logger.info(f"Training with {len(X)} properties")
@@ -220,108 +622,15 @@ async def train_model(
             logger.warning(f"Not enough data for train/test split: {len(X)} samples.")
             raise Exception(f"Not enough data for train/test split: {len(X)} samples")
 
+        from sklearn.model_selection import train_test_split
+
         logger.info("Performing train/test split.")
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=0.2, random_state=42
         )
         logger.debug(f"Train samples: {len(X_train)}, Test samples: {len(X_test)}")
 
-        # Scale features
-        logger.info("Scaling features.")
-        scaler_X = StandardScaler()
-        X_train_scaled = scaler_X.fit_transform(X_train)
-        X_test_scaled = scaler_X.transform(X_test)
-        logger.debug("Features scaled.")
-
-        # Scale target - CRITICAL FIX: Reshape to 2D array
-        logger.info("Scaling target variable.")
-        scaler_y = StandardScaler()
-        y_train_scaled = scaler_y.fit_transform(y_train.values.reshape(-1, 1))
-        y_test_scaled = scaler_y.transform(y_test.values.reshape(-1, 1))
-        logger.debug("Target variable scaled.")
-
-        logger.info("Building TensorFlow Keras model.")
-
-        # Dynamic model architecture based on dataset size
         num_samples = len(X_train)
-
-        # Scale model complexity with data size
-        # Small datasets (< 30): simpler model
-        # Medium datasets (30-100): moderate complexity
-        # Large datasets (> 100): full complexity
-        if num_samples < 30:
-            first_layer = min(32, num_samples * 2)
-            second_layer = min(16, num_samples)
-            dropout_rate = 0.2
-        elif num_samples < 100:
-            first_layer = 64
-            second_layer = 32
-            dropout_rate = 0.3
-        else:
-            first_layer = 128
-            second_layer = 64
-            dropout_rate = 0.4
-
-        logger.info(
-            f"Dynamic model architecture: [{first_layer}, {second_layer}] "
-            f"with dropout={dropout_rate} for {num_samples} training samples"
-        )
-
-        model = tf.keras.Sequential(
-            [
-                tf.keras.layers.Dense(first_layer, activation="relu"),
-                tf.keras.layers.Dropout(dropout_rate),
-                tf.keras.layers.Dense(second_layer, activation="relu"),
-                tf.keras.layers.Dropout(dropout_rate),
-                tf.keras.layers.Dense(1),
-            ]
-        )
-
-        # Fixed: Removed 'accuracy' metric (not suitable for regression)
-        model.compile(
-            optimizer=tf.keras.optimizers.Adam(learning_rate=0.001),
-            loss="mse",
-            metrics=["mae"],
-        )
-        logger.info("Model compiled successfully.")
-
-        # Add early stopping with dynamic patience based on dataset size
-        # Smaller datasets need more patience as they're more volatile
-        patience = max(10, min(20, num_samples // 3))
-        early_stopping = tf.keras.callbacks.EarlyStopping(
-            monitor="val_loss", patience=patience, restore_best_weights=True
-        )
-        logger.info(f"Early stopping callback added with patience={patience}.")
-
-        logger.info("Starting model training.")
-
-        # Dynamic epochs based on dataset size
-        # Smaller datasets need more epochs to learn patterns
-        if num_samples < 30:
-            epochs = 100
-        elif num_samples < 100:
-            epochs = 50
-        else:
-            epochs = 30
-
-        logger.info(
-            f"Training for up to {epochs} epochs (early stopping may end training sooner)"
-        )
-
-        history = model.fit(
-            X_train_scaled,
-            y_train_scaled,
-            validation_data=(X_test_scaled, y_test_scaled),
-            epochs=epochs,
-            batch_size=min(16, len(X_train)),
-            callbacks=[early_stopping],
-            verbose=1,
-        )
-        logger.info("Model training completed.")
-
-        logger.info(f"Final training loss: {history.history['loss'][-1]:.4f}")
-        logger.info(f"Final validation loss: {history.history['val_loss'][-1]:.4f}")
-
         model_dir = (
             model_filename  # `model_filename` is already the full path to the directory
         )
@@ -331,34 +640,41 @@ async def train_model(
         # Extract the base name from the full path for artifact filenames
         model_base_name = os.path.basename(model_dir)
 
-        model.save(os.path.join(model_dir, "tf_model.keras"))
-        logger.debug("TensorFlow model saved.")
-
-        # Save BOTH scalers
-        joblib.dump(
-            scaler_X, os.path.join(model_dir, f"{model_base_name}_scaler_X.joblib")
-        )
-        joblib.dump(
-            scaler_y, os.path.join(model_dir, f"{model_base_name}_scaler_y.joblib")
-        )
-        logger.debug("Scalers saved.")
+        # Small datasets are fitted with trees, skipping TensorFlow altogether.
+        # The other backend's artifacts of an earlier training are removed, so
+        # the model loader cannot pick them up instead.
+        if num_samples < SKLEARN_MAX_TRAIN_SAMPLES:
+            backend = "sklearn"
+            _remove_artifacts(
+                model_dir,
+                [
+                    "tf_model.keras",
+                    SAVED_MODEL_DIRNAME,
+                    f"{model_base_name}_scaler_X.npz",
+                    f"{model_base_name}_scaler_y.npz",
+                ],
+            )
+            _train_gradient_boosting(X_train, X_test, y_train, y_test, model_dir)
+        else:
+            backend = "keras"
+            _remove_artifacts(model_dir, [SKLEARN_MODEL_FILENAME])
+            _train_keras_model(
+                X_train, X_test, y_train, y_test, model_dir, model_base_name
+            )
 
         # Fixed: Updated metadata to include all 6 features
-        joblib.dump(
-            {
-                "features": [
-                    "star_rating",
-                    "guest_rating_score",
-                    "reviews",
-                    "distance_from_downtown",
-                    "distance_from_beach",
-                    "preferred_badge",
-                ],
-                "target": "discounted_price_value",
-                "currency": currency,
-            },
-            os.path.join(model_dir, f"{model_base_name}_meta.joblib"),
-        )
+        with open(os.path.join(model_dir, f"{model_base_name}_meta.json"), "w") as f:
+            json.dump(
+                {
+                    "features": BASIC_FEATURE_COLUMNS,
+                    "binary_features": ["preferred_badge"],
+                    "target": "discounted_price_value",
+                    "currency": currency,
+                    "backend": backend,
+                },
+                f,
+                indent=4,
+            )
         logger.debug("Metadata saved.")
 
         logger.info("Basic price predictor created and saved successfully.")
@@ -370,3 +686,32 @@ async def train_model(
             exc_info=True,
         )
         raise Exception(f"Error creating basic price predictor: {str(e)}")
+
+
+async def train_model(
+    properties_df: pd.DataFrame,
+    hotel_details_df: pd.DataFrame,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,  # This is properties_limit
+    hotel_details_limit: int,
+    model_filename: str,
+) -> str:
+    """
+    Runs `train_model_sync` in a worker thread.
+
+    Fitting the network is CPU-bound and takes far longer than a request, so
+    it is kept off the event loop, like prediction in `predict_price`.
+    """
+    return await asyncio.to_thread(
+        train_model_sync,
+        properties_df,
+        hotel_details_df,
+        destination,
+        adults,
+        rooms,
+        limit,
+        hotel_details_limit,
+        model_filename,
+    )
@@ -0,0 +1,48 @@
+import weakref
+
+from playwright.async_api import Page, Route
+
+from app.utils.logger import logger
+
+# Resource types no extraction reads: the facility icons are CSS, not images.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+# Analytics and tracking hosts, whose scripts only compete with the page's own.
+_BLOCKED_HOSTS = (
+    "googletagmanager",
+    "google-analytics",
+    "doubleclick",
+    "facebook.net",
+    "hotjar",
+)
+# Pages the route is already installed on: a page reused for several hotels
+# would otherwise stack one more identical handler per hotel.
+_BLOCKING_PAGES: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+
+async def _block_or_continue(route: Route) -> None:
+    """Aborts a request for a blocked resource type or host, lets any other through."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        host in request.url for host in _BLOCKED_HOSTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def block_unneeded_resources(page: Page) -> None:
+    """
+    Stops the page from downloading images, media, fonts and analytics scripts.
+
+    Hotel pages pull megabytes of photos and tracking the scraper never reads,
+    all competing with the HTML and scripts that render the content it does.
+    Must be called before navigating; calling it again for a page is a no-op.
+
+    Args:
+        page: Playwright page object.
+    """
+    if page in _BLOCKING_PAGES:
+        return
+    await page.route("**/*", _block_or_continue)
+    _BLOCKING_PAGES.add(page)
+    logger.debug("Blocking images, media, fonts and analytics requests.")
@@ -0,0 +1,96 @@
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import Page
+
+from app.utils.logger import logger
+
+# Mirrors the Playwright locators used per group before: a group is the first
+# facility-group container with an h3 containing its name (case-insensitive,
+# whitespace-normalised, like Playwright's :has-text), its items the texts of
+# its "li .f6b6d2a959" elements. A group's "details" text is the first
+# ".b99b6ef58f.fb14de7f14" element inside any of its matching containers.
+_EXTRACT_FACILITY_GROUPS_JS = """
+({itemGroups, detailGroups}) => {
+    const normalize = (text) => text.replace(/\\s+/g, " ").trim().toLowerCase();
+    const containers = [
+        ...document.querySelectorAll('[data-testid="facility-group-container"]'),
+    ].map((container) => ({
+        container,
+        headings: [...container.querySelectorAll("h3")].map(
+            (h) => normalize(h.innerText || "")
+        ),
+    }));
+    const matching = (name) => {
+        const key = normalize(name);
+        return containers
+            .filter(({headings}) => headings.some((h) => h.includes(key)))
+            .map(({container}) => container);
+    };
+    const items = {};
+    for (const name of itemGroups) {
+        const [group] = matching(name);
+        items[name] = group
+            ? [...group.querySelectorAll("li .f6b6d2a959")]
+                .map((item) => (item.innerText || "").trim())
+                .filter(Boolean)
+            : [];
+    }
+    const details = {};
+    for (const name of detailGroups) {
+        details[name] = null;
+        for (const group of matching(name)) {
+            const element = group.querySelector(".b99b6ef58f.fb14de7f14");
+            if (element) {
+                details[name] = element.innerText;
+                break;
+            }
+        }
+    }
+    return {items, details};
+}
+"""
+
+
+async def extract_all_facility_groups(
+    page: Page, group_names: List[str], detail_group_names: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Extracts several facility groups from the page in a single browser round trip.
+
+    Reading each group through locators costs a count plus one `inner_text`
+    call per item, each a round trip to the browser. Here one `page.evaluate`
+    walks the facility groups in the DOM and returns them all.
+
+    Args:
+        page (Page): The hotel page, fully scrolled.
+        group_names (List[str]): Groups whose list items to extract.
+        detail_group_names (List[str]): Groups whose details text to extract
+            (e.g. "Internet", "Parking").
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Under "items", each group's list of items, or
+            None if it has none, and under "details", each detail group's text,
+            or None if it has none.
+    """
+    logger.info(f"Extracting facility groups: {', '.join(group_names)}")
+    try:
+        result = await page.evaluate(
+            _EXTRACT_FACILITY_GROUPS_JS,
+            {"itemGroups": group_names, "detailGroups": detail_group_names},
+        )
+    except Exception as e:
+        logger.debug(f"Could not extract facility groups: {e}")
+        result = {"items": {}, "details": {}}
+
+    items: Dict[str, Optional[List[str]]] = {}
+    for name in group_names:
+        facilities = result["items"].get(name) or None
+        if facilities:
+            logger.info(
+                f"Successfully extracted {len(facilities)} facilities for group: {name}"
+            )
+        else:
+            logger.info(f"No facilities found for group: {name}")
+        items[name] = facilities
+    details = {name: result["details"].get(name) for name in detail_group_names}
+    return {"items": items, "details": details}
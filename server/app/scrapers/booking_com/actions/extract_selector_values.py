@@ -0,0 +1,90 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from playwright.async_api import Page
+
+from app.utils.logger import logger
+
+# Playwright's `:has-text("...")` is not CSS, so it is split off the selector
+# and applied in the page as a case-insensitive substring filter.
+_HAS_TEXT_PATTERN = re.compile(r'^(?P<css>.*):has-text\("(?P<text>[^"]*)"\)$')
+
+_EXTRACT_SELECTOR_VALUES_JS = """
+(queries) => {
+    const normalize = (text) => text.replace(/\\s+/g, " ").trim().toLowerCase();
+    const matches = ({css, text}) => {
+        const elements = [...document.querySelectorAll(css)];
+        if (text === null) return elements;
+        const key = normalize(text);
+        return elements.filter((e) => normalize(e.innerText || "").includes(key));
+    };
+    const result = {};
+    for (const [field, {selectors, kind, attribute}] of Object.entries(queries)) {
+        result[field] = selectors.map((selector) => {
+            let elements;
+            try {
+                elements = matches(selector);
+            } catch (e) {  // Invalid selector: treated as matching nothing
+                elements = [];
+            }
+            if (kind === "count") return elements.length;
+            if (kind === "texts") {
+                return elements.length ? elements.map((e) => e.innerText) : null;
+            }
+            if (!elements.length) return null;
+            return kind === "attribute"
+                ? elements[0].getAttribute(attribute)
+                : elements[0].innerText;
+        });
+    }
+    return result;
+}
+"""
+
+
+def _split_selector(selector: str) -> Dict[str, Optional[str]]:
+    """Splits a trailing `:has-text("...")` off a selector."""
+    match = _HAS_TEXT_PATTERN.match(selector)
+    if match is None:
+        return {"css": selector, "text": None}
+    return {"css": match["css"], "text": match["text"]}
+
+
+async def extract_selector_values(
+    page: Page, queries: Dict[str, Tuple[List[str], str]]
+) -> Dict[str, List[Any]]:
+    """
+    Reads the matches of several fallback selector lists in one `page.evaluate`.
+
+    Trying each selector through a locator costs a count plus a read, each a
+    round trip to the browser. Here every selector of every field is resolved
+    in the page at once, and the caller picks the first usable value per field.
+
+    Args:
+        page (Page): The page to read.
+        queries (Dict[str, Tuple[List[str], str]]): Per field, its selectors in
+            order of preference and what to read from their matches: "text"
+            (the first match's inner text), "texts" (every match's inner text),
+            "count" (the number of matches) or "attribute:<name>" (the first
+            match's attribute). Selectors may end in Playwright's `:has-text("...")`.
+
+    Returns:
+        Dict[str, List[Any]]: Per field, one value per selector, None where the
+            selector matched nothing (counts are 0 instead).
+    """
+    payload = {}
+    for field, (selectors, kind) in queries.items():
+        kind, _, attribute = kind.partition(":")
+        payload[field] = {
+            "selectors": [_split_selector(selector) for selector in selectors],
+            "kind": kind,
+            "attribute": attribute or None,
+        }
+    try:
+        return await page.evaluate(_EXTRACT_SELECTOR_VALUES_JS, payload)
+    except Exception as e:
+        logger.debug(f"Could not extract selector values: {e}")
+        return {
+            field: [0 if kind == "count" else None for _ in selectors]
+            for field, (selectors, kind) in queries.items()
+        }
@@ -16,14 +16,49 @@ from app.scrapers.booking_com.extractors.specific_property_extractor import (
     scrape_specific_property_data,
 )
 from app.scrapers.booking_com.orchestrator.scrape_general_data import (
+    load_cached_general_data,
     scrape_general_data,
 )
+from app.scrapers.booking_com.processing.rate_limiter import AsyncRateLimiter
+from app.utils.cache.hotel_cache import get_cached_hotel_data
 from app.utils.constants import (
     get_model_filepath,
 )
 from app.utils.logger import logger
 
 
+async def _retrain_model(
+    model_filepath: str,
+    general_df_properties: pd.DataFrame,
+    general_df_hotel_details: pd.DataFrame,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,
+    hotel_details_limit: int,
+) -> None:
+    """Trains the model on the given general data and records its training metadata."""
+    logger.info(f"Initiating retraining for model '{model_filepath}'...")
+    await train_model(
+        general_df_properties,
+        general_df_hotel_details,
+        destination,
+        adults,
+        rooms,
+        limit,
+        hotel_details_limit,
+        model_filepath,
+    )
+    # Save new metadata based on the data actually used for training
+    metadata = {
+        "last_trained_at": datetime.now().isoformat(),
+        "trained_properties_count": len(general_df_properties),
+        "trained_hotel_details_count": len(general_df_hotel_details),
+    }
+    save_model_metadata(model_filename=model_filepath, metadata=metadata)
+    logger.success(f"Model '{model_filepath}' retrained and metadata updated.")
+
+
 async def scrape_booking_com_data(
     destination: str,
     model_type: str = "basic",
@@ -34,6 +69,7 @@ async def scrape_booking_com_data(
     force_refetch: bool = False,
     target_hotel_name: Optional[str] = None,
     force_fetch_delay: Optional[timedelta] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
 ) -> Tuple[
     Optional[PropertyListing],
     Optional[HotelDetails],
@@ -52,6 +88,7 @@ async def scrape_booking_com_data(
         force_refetch (bool): If True, forces refetching of data even if cached. Defaults to False.
         target_hotel_name (Optional[str]): Specific hotel name to target during scraping. Defaults to None.
         force_fetch_delay (Optional[timedelta]): Delay to force refetching after. Defaults to None (7 days).
+        rate_limiter (Optional[AsyncRateLimiter]): Limiter shared by the hotel detail scrapes. Defaults to None (no limit).
 
     Returns:
         Tuple[Optional[PropertyListing], Optional[HotelDetails]]:
@@ -60,6 +97,50 @@ async def scrape_booking_com_data(
     """
     logger.debug(f"hotel_details_limit received: {hotel_details_limit}")
 
+    model_filepath = get_model_filepath(
+        destination,
+        adults,
+        rooms,
+        limit,
+        hotel_details_limit,
+        model_name=f"{model_type}_price_predictor",
+    )
+
+    # --- Cache-only path: skip launching Chromium when everything is on disk ---
+    if not force_refetch:
+        cached_general_data = load_cached_general_data(
+            destination, hotel_details_limit, adults, rooms, limit, force_fetch_delay
+        )
+        cached_target = None
+        if cached_general_data is not None and target_hotel_name:
+            cached_target = get_cached_hotel_data(target_hotel_name, adults, rooms)
+        if cached_general_data is not None and (
+            not target_hotel_name or cached_target is not None
+        ):
+            logger.info("All requested data is cached. Skipping the browser launch.")
+            general_df_properties, general_df_hotel_details = cached_general_data
+            if should_retrain_model(
+                model_filepath,
+                len(general_df_properties),
+                len(general_df_hotel_details),
+            ):
+                logger.info(f"Retraining model '{model_filepath}' is recommended.")
+                await _retrain_model(
+                    model_filepath,
+                    general_df_properties,
+                    general_df_hotel_details,
+                    destination,
+                    adults,
+                    rooms,
+                    limit,
+                    hotel_details_limit,
+                )
+            else:
+                logger.info(
+                    f"Model '{model_filepath}' is up-to-date. Skipping retraining."
+                )
+            return cached_target if cached_target is not None else (None, None)
+
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
         specific_property: Optional[PropertyListing] = None
@@ -105,18 +186,10 @@ async def scrape_booking_com_data(
                 force_refetch,
                 specific_property_to_exclude=specific_property,
                 force_fetch_delay=force_fetch_delay,
+                rate_limiter=rate_limiter,
             )
 
             # --- Dynamic Model Training ---
-            model_filepath = get_model_filepath(
-                destination,
-                adults,
-                rooms,
-                limit,
-                hotel_details_limit,
-                model_name=f"{model_type}_price_predictor",
-            )
-
             if should_retrain_model(
                 model_filepath,
                 len(general_df_properties),
@@ -141,15 +214,15 @@ async def scrape_booking_com_data(
                         force_refetch=force_refetch,
                         specific_property_to_exclude=specific_property,
                         force_fetch_delay=force_fetch_delay,
+                        rate_limiter=rate_limiter,
                     )
                 else:
                     logger.info(
                         "General data already refetched due to --force_refetch flag."
                     )
 
-                logger.info(f"Initiating retraining for model '{model_filepath}'...")
-                # Assuming train_model in basic_trainer takes properties_df and hotel_details_df
-                await train_model(
+                await _retrain_model(
+                    model_filepath,
                     general_df_properties,  # Use the potentially refetched data
                     general_df_hotel_details,  # Use the potentially refetched data
                     destination,
@@ -157,19 +230,6 @@ async def scrape_booking_com_data(
                     rooms,
                     limit,
                     hotel_details_limit,
-                    model_filepath,
-                )
-                # Save new metadata based on the data actually used for training
-                metadata = {
-                    "last_trained_at": datetime.now().isoformat(),
-                    "trained_properties_count": len(general_df_properties),
-                    "trained_hotel_details_count": len(general_df_hotel_details),
-                }
-                # Extract the base name from the full model_filepath for metadata saving
-
-                save_model_metadata(model_filename=model_filepath, metadata=metadata)
-                logger.success(
-                    f"Model '{model_filepath}' retrained and metadata updated."
                 )
             else:
                 logger.info(
@@ -16,18 +16,128 @@ from app.scrapers.booking_com.playwright_urls import BookingComUrls
 from app.scrapers.booking_com.processing.concurrent_scrapers import (
     scrape_hotel_data_concurrent,
 )
+from app.scrapers.booking_com.processing.rate_limiter import AsyncRateLimiter
 from app.scrapers.booking_com.utils import modal_dismisser,ensure_usd_and_english_uk
 from app.utils.cache.cache_url import cache_url
 from app.utils.cache.get_cached_url import get_cached_url
 from app.utils.constants import (
     get_scraped_data_filepath,
 )
-from app.utils.file_io.read_scraped_data_from_csv import read_scraped_data_from_csv
-from app.utils.file_io.save_hotel_detail_data_to_csv import save_hotel_detail_data_to_csv
-from app.utils.file_io.save_scraped_data_to_csv import save_scraped_data_to_csv
+from app.utils.file_io import (
+    read_scraped_data_from_csv,
+    read_scraped_data_from_parquet,
+    save_hotel_detail_data_to_csv,
+    save_scraped_data_to_csv,
+    save_scraped_data_to_parquet,
+)
 from app.utils.logger import logger
 
 
+def _read_cached_data(
+    csv_path: str, parquet_path: str, is_hotel_detail: bool = False
+) -> pd.DataFrame:
+    """
+    Reads cached scraped data, preferring the Parquet copy over the CSV.
+
+    The Parquet copy is written after the CSV, so it is only used when it is
+    at least as new. A Parquet file older than the CSV is left over from an
+    earlier scrape whose refetch failed to replace it, and would be stale.
+    """
+    if os.path.exists(parquet_path) and os.path.getmtime(
+        parquet_path
+    ) >= os.path.getmtime(csv_path):
+        try:
+            return read_scraped_data_from_parquet(parquet_path)
+        except Exception as e:
+            logger.warning(
+                f"Failed to read Parquet cache {parquet_path}: {e}. Falling back to CSV."
+            )
+    return read_scraped_data_from_csv(csv_path, is_hotel_detail=is_hotel_detail)
+
+
+def _load_fresh_cache(
+    csv_path: str,
+    parquet_path: str,
+    delay_seconds: float,
+    label: str,
+    is_hotel_detail: bool = False,
+) -> Optional[pd.DataFrame]:
+    """Returns the cached data if the CSV is younger than `delay_seconds`, else None."""
+    if not os.path.exists(csv_path):
+        return None
+    if (time.time() - os.path.getmtime(csv_path)) >= delay_seconds:
+        return None
+
+    logger.info(f"Attempting to use cached {label} data from {csv_path}")
+    try:
+        df = _read_cached_data(csv_path, parquet_path, is_hotel_detail=is_hotel_detail)
+    except Exception as e:
+        logger.warning(
+            f"Failed to read cached {label} data: {e}. Will attempt to scrape."
+        )
+        return None
+    logger.success(f"Successfully loaded {len(df)} {label} from cache.")
+    return df
+
+
+def load_cached_general_data(
+    destination: str,
+    hotel_details_limit: int,
+    adults: int,
+    rooms: int,
+    limit: int,
+    force_fetch_delay: Optional[timedelta] = None,
+) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Loads the general properties and hotel details from the on-disk cache only.
+
+    The cache files are keyed by destination, adults, rooms and the respective
+    limit, and are considered fresh for `force_fetch_delay` (7 days by default).
+
+    Args:
+        destination (str): The destination the data was scraped for.
+        hotel_details_limit (int): The hotel details limit the data was scraped with.
+        adults (int): Number of adults.
+        rooms (int): Number of rooms.
+        limit (int): The properties limit the data was scraped with.
+        force_fetch_delay (Optional[timedelta]): Maximum cache age. Defaults to 7 days.
+
+    Returns:
+        Optional[Tuple[pd.DataFrame, pd.DataFrame]]: The cached properties and hotel
+            details, or None if either is missing, stale or unreadable.
+    """
+    delay_seconds = (force_fetch_delay or timedelta(days=7)).total_seconds()
+    properties = _load_fresh_cache(
+        get_scraped_data_filepath("properties", destination, adults, rooms, limit),
+        get_scraped_data_filepath(
+            "properties", destination, adults, rooms, limit, file_format="parquet"
+        ),
+        delay_seconds,
+        "general properties",
+    )
+    if properties is None:
+        return None
+    hotel_details = _load_fresh_cache(
+        get_scraped_data_filepath(
+            "hotel_details", destination, adults, rooms, hotel_details_limit
+        ),
+        get_scraped_data_filepath(
+            "hotel_details",
+            destination,
+            adults,
+            rooms,
+            hotel_details_limit,
+            file_format="parquet",
+        ),
+        delay_seconds,
+        "general hotel details",
+        is_hotel_detail=True,
+    )
+    if hotel_details is None:
+        return None
+    return properties, hotel_details
+
+
 async def scrape_general_data(
     browser: Browser,
     destination: str,
@@ -38,6 +148,7 @@ async def scrape_general_data(
     force_refetch: bool,
     force_fetch_delay: Optional[timedelta],
     specific_property_to_exclude: Optional[PropertyListing] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     properties_file_path = get_scraped_data_filepath(
         "properties", destination, adults, rooms, limit
@@ -45,6 +156,17 @@ async def scrape_general_data(
     hotel_details_file_path = get_scraped_data_filepath(
         "hotel_details", destination, adults, rooms, hotel_details_limit
     )
+    properties_parquet_path = get_scraped_data_filepath(
+        "properties", destination, adults, rooms, limit, file_format="parquet"
+    )
+    hotel_details_parquet_path = get_scraped_data_filepath(
+        "hotel_details",
+        destination,
+        adults,
+        rooms,
+        hotel_details_limit,
+        file_format="parquet",
+    )
 
     scraped_properties: pd.DataFrame = pd.DataFrame()
     hotel_details_data: pd.DataFrame = pd.DataFrame()
@@ -52,40 +174,29 @@ async def scrape_general_data(
     delay_seconds = (force_fetch_delay or timedelta(days=7)).total_seconds()
 
     properties_from_cache = False
-    if not force_refetch and os.path.exists(properties_file_path):
-        if (time.time() - os.path.getmtime(properties_file_path)) < delay_seconds:
-            logger.info(
-                f"Attempting to use cached general properties data from {properties_file_path}"
-            )
-            try:
-                scraped_properties = read_scraped_data_from_csv(properties_file_path)
-                logger.success(
-                    f"Successfully loaded {len(scraped_properties)} general properties from cache."
-                )
-                properties_from_cache = True
-            except Exception as e:
-                logger.warning(
-                    f"Failed to read cached general properties data: {e}. Will attempt to scrape."
-                )
+    if not force_refetch:
+        cached_properties = _load_fresh_cache(
+            properties_file_path,
+            properties_parquet_path,
+            delay_seconds,
+            "general properties",
+        )
+        if cached_properties is not None:
+            scraped_properties = cached_properties
+            properties_from_cache = True
 
     hotel_details_from_cache = False
-    if not force_refetch and os.path.exists(hotel_details_file_path):
-        if (time.time() - os.path.getmtime(hotel_details_file_path)) < delay_seconds:
-            logger.info(
-                f"Attempting to use cached general hotel details data from {hotel_details_file_path}"
-            )
-            try:
-                hotel_details_data = read_scraped_data_from_csv(
-                    hotel_details_file_path, is_hotel_detail=True
-                )
-                logger.success(
-                    f"Successfully loaded {len(hotel_details_data)} general hotel details from cache."
-                )
-                hotel_details_from_cache = True
-            except Exception as e:
-                logger.warning(
-                    f"Failed to read cached general hotel details data: {e}. Will attempt to scrape."
-                )
+    if not force_refetch:
+        cached_hotel_details = _load_fresh_cache(
+            hotel_details_file_path,
+            hotel_details_parquet_path,
+            delay_seconds,
+            "general hotel details",
+            is_hotel_detail=True,
+        )
+        if cached_hotel_details is not None:
+            hotel_details_data = cached_hotel_details
+            hotel_details_from_cache = True
 
     if not properties_from_cache or not hotel_details_from_cache or force_refetch:
         context = await browser.new_context(
@@ -166,9 +277,25 @@ async def scrape_general_data(
                     )
                 except Exception as e:
                     logger.error(f"Failed to save scraped properties to CSV: {e}")
+                try:
+                    save_scraped_data_to_parquet(
+                        scraped_properties,
+                        "properties",
+                        destination,
+                        adults,
+                        rooms,
+                        limit,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to save scraped properties to Parquet: {e}")
 
             if not hotel_details_from_cache or force_refetch:
-                if scraped_properties.empty:
+                if hotel_details_limit == 0:
+                    logger.info(
+                        "hotel_details_limit is 0, skipping general hotel detail scraping."
+                    )
+                    hotel_details_data = pd.DataFrame()
+                elif scraped_properties.empty:
                     logger.warning(
                         "No general properties available to scrape hotel details for."
                     )
@@ -186,7 +313,7 @@ async def scrape_general_data(
                         f"Scraping details for {len(hotel_urls_to_scrape)} general hotels concurrently."
                     )
                     general_hotel_details = await scrape_hotel_data_concurrent(
-                        browser, hotel_urls_to_scrape
+                        browser, hotel_urls_to_scrape, rate_limiter=rate_limiter
                     )
                     if specific_property_to_exclude:
                         general_hotel_details = [
@@ -205,12 +332,6 @@ async def scrape_general_data(
                         [asdict(h) for h in general_hotel_details]
                     )
 
-                if hotel_details_limit == 0:
-                    logger.info(
-                        "hotel_details_limit is 0, skipping general hotel detail scraping."
-                    )
-                    hotel_details_data = pd.DataFrame()
-
                 try:
                     save_hotel_detail_data_to_csv(
                         hotel_details_data,
@@ -221,6 +342,19 @@ async def scrape_general_data(
                     )
                 except Exception as e:
                     logger.error(f"Failed to save general hotel details to CSV: {e}")
+                try:
+                    save_scraped_data_to_parquet(
+                        hotel_details_data,
+                        "hotel_details",
+                        destination,
+                        adults,
+                        rooms,
+                        hotel_details_limit,
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to save general hotel details to Parquet: {e}"
+                    )
 
         finally:
             await page.close()
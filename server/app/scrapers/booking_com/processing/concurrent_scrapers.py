@@ -1,15 +1,24 @@
 import asyncio
-from typing import List
+import os
+from typing import List, Optional
 
 from playwright.async_api import Browser
 
 from app.data_models import HotelDetails
 from app.utils.logger import logger
 from app.scrapers.booking_com.extractors.hotel_details_extractor import scrape_hotel_data
+from app.scrapers.booking_com.processing.rate_limiter import AsyncRateLimiter
+
+# Each hotel page gets its own renderer process, which is CPU-bound while the
+# page loads and is parsed, so more concurrent pages than cores only queue up.
+DEFAULT_MAX_CONCURRENT = max(2, min(8, os.cpu_count() or 2))
 
 
 async def scrape_hotel_data_concurrent(
-    browser: Browser, urls: List[str], max_concurrent: int = 5
+    browser: Browser,
+    urls: List[str],
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
 ) -> List[HotelDetails]:
     """
     Scrape multiple hotel pages concurrently.
@@ -17,7 +26,9 @@ async def scrape_hotel_data_concurrent(
     Args:
         browser: Playwright browser instance.
         urls: List of hotel URLs to scrape.
-        max_concurrent: Maximum number of concurrent scraping tasks.
+        max_concurrent: Maximum number of concurrent scraping tasks, by default
+            the number of CPU cores, between 2 and 8.
+        rate_limiter: Optional limiter shared by all tasks to cap how often hotel pages are opened.
 
     Returns:
         List[HotelDetails]: A list of HotelDetails objects.
@@ -26,13 +37,15 @@ async def scrape_hotel_data_concurrent(
 
     async def scrape_with_semaphore(url: str):
         async with semaphore:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
             context = await browser.new_context()
             page = await context.new_page()
             try:
                 result = await scrape_hotel_data(page, url)
                 return result
             finally:
-                await page.close()
+                # Closing the context closes its page too, in one round trip.
                 await context.close()
 
     # Create tasks for all URLs
@@ -0,0 +1,42 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """
+    Spaces out async operations to at most `max_rate` per `time_period` seconds.
+
+    Usage:
+        limiter = AsyncRateLimiter(max_rate=3)
+        async with limiter:
+            await page.goto(url)
+
+    Acquisitions are granted in order at evenly spaced slots, so concurrent
+    tasks share one steady request rate instead of bursting and then backing off.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0) -> None:
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive.")
+        self._interval = time_period / max_rate
+        self._next_slot = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        """Waits until the next request slot is available and claims it."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
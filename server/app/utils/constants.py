@@ -1,5 +1,6 @@
 import os
 import re
+from functools import lru_cache
 from typing import List, Dict
 
 # app/utils/constants.py
@@ -16,32 +17,60 @@ HOTEL_DETAILS_CSV_PATH_TEMPLATE = (
     f"{BASE_SCAPRED_DIR}/hotel_details/{{destination}}/{{adults}}/{{rooms}}/limit_{{limit}}.csv"
 )
 
+# Templates for the Parquet copies of the scraped data, which keep list/dict columns native
+PROPERTIES_PARQUET_PATH_TEMPLATE = (
+    f"{BASE_SCAPRED_DIR}/properties/{{destination}}/{{adults}}/{{rooms}}/limit_{{limit}}.parquet"
+)
+HOTEL_DETAILS_PARQUET_PATH_TEMPLATE = (
+    f"{BASE_SCAPRED_DIR}/hotel_details/{{destination}}/{{adults}}/{{rooms}}/limit_{{limit}}.parquet"
+)
+
 # Cache file path for URLs
 URL_CSV_PATH = f"{BASE_SCAPRED_DIR}/urls.csv"
 
 # Directory for storing machine learning model artifacts
 ML_MODEL_DIR = BASE_ML_DIR
 
+# Directory, inside a model's directory, of its exported SavedModel
+SAVED_MODEL_DIRNAME = "saved_model"
+
+# File name of a model trained with scikit-learn instead of Keras, in its model directory
+SKLEARN_MODEL_FILENAME = "sklearn_model.joblib"
+
+# Directory for the cleaned training frames reused across identical retrains
+TRAINING_CACHE_DIR = os.path.join(BASE_ML_DIR, "training_cache")
+
 
 def get_scraped_data_filepath(
-    data_type: str, destination: str, adults: int, rooms: int, limit: int
+    data_type: str,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,
+    file_format: str = "csv",
 ) -> str:
     """
-    Constructs the correct file path for scraped data CSVs.
+    Constructs the correct file path for scraped data files.
     data_type can be "properties" or "hotel_details".
+    file_format can be "csv" or "parquet".
     """
-    if data_type == "properties":
-        return PROPERTIES_CSV_PATH_TEMPLATE.format(
-            destination=destination, adults=adults, rooms=rooms, limit=limit
-        )
-    elif data_type == "hotel_details":
-        return HOTEL_DETAILS_CSV_PATH_TEMPLATE.format(
-            destination=destination, adults=adults, rooms=rooms, limit=limit
-        )
-    else:
-        raise ValueError(f"Unknown data_type: {data_type}")
+    templates = {
+        ("properties", "csv"): PROPERTIES_CSV_PATH_TEMPLATE,
+        ("hotel_details", "csv"): HOTEL_DETAILS_CSV_PATH_TEMPLATE,
+        ("properties", "parquet"): PROPERTIES_PARQUET_PATH_TEMPLATE,
+        ("hotel_details", "parquet"): HOTEL_DETAILS_PARQUET_PATH_TEMPLATE,
+    }
+    template = templates.get((data_type, file_format))
+    if template is None:
+        raise ValueError(f"Unknown data_type/file_format: {data_type}/{file_format}")
+    return template.format(
+        destination=destination, adults=adults, rooms=rooms, limit=limit
+    )
 
 
+# Pure string formatting, called for the same few models on every prediction
+# and retrain check, so the resolved paths are memoized.
+@lru_cache(maxsize=256)
 def get_model_filepath(
     destination: str,
     adults: int,
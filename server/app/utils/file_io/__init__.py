@@ -0,0 +1,15 @@
+from app.utils.file_io.read_scraped_data_from_csv import read_scraped_data_from_csv
+from app.utils.file_io.read_scraped_data_from_parquet import (
+    read_scraped_data_from_parquet,
+)
+from app.utils.file_io.save_hotel_detail_data_to_csv import save_hotel_detail_data_to_csv
+from app.utils.file_io.save_scraped_data_to_csv import save_scraped_data_to_csv
+from app.utils.file_io.save_scraped_data_to_parquet import save_scraped_data_to_parquet
+
+__all__ = [
+    "read_scraped_data_from_csv",
+    "read_scraped_data_from_parquet",
+    "save_hotel_detail_data_to_csv",
+    "save_scraped_data_to_csv",
+    "save_scraped_data_to_parquet",
+]
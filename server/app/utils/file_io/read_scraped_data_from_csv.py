@@ -1,5 +1,6 @@
 import pandas as pd
 
+from app.utils.file_io.structured_columns import decode_structured_columns
 from app.utils.logger import logger
 
 
@@ -9,24 +10,31 @@ def read_scraped_data_from_csv(
     """
     Reads scraped data from a CSV file into a pandas DataFrame.
 
+    Uses the multithreaded pyarrow CSV engine when pyarrow is installed and
+    falls back to the C engine over a memory-mapped file otherwise.
+
     Args:
         file_path (str): The path to the CSV file.
         is_hotel_detail (bool): Flag indicating if the data is hotel detail data.
-                                 (Currently not used for different parsing logic, but kept for context).
+                                 If True, the list/dict columns are decoded back into Python objects.
 
     Returns:
         pd.DataFrame: The DataFrame containing the scraped data.
     """
-    logger.info(
-        f"Attempting to read scraped data from CSV: {file_path}. "
-        f"is_hotel_detail: {is_hotel_detail}"
-    )
     try:
-        df = pd.read_csv(file_path)
-        logger.debug(f"Read {len(df)} rows from {file_path}.")
+        try:
+            df = pd.read_csv(file_path, engine="pyarrow")
+        except ImportError:
+            logger.debug("pyarrow is not installed, using the C engine for CSV parsing.")
+            df = pd.read_csv(file_path, memory_map=True, low_memory=False)
         df = df.where(pd.notnull(df), None)
-        logger.debug("Replaced NaN values with None in DataFrame.")
+        if is_hotel_detail:
+            df = decode_structured_columns(df)
 
+        logger.info(
+            f"Read {len(df)} rows of scraped data from CSV: {file_path}. "
+            f"is_hotel_detail: {is_hotel_detail}"
+        )
         return df
     except Exception as e:
         logger.error(
@@ -0,0 +1,39 @@
+import pandas as pd
+
+from app.utils.logger import logger
+
+
+def read_scraped_data_from_parquet(file_path: str) -> pd.DataFrame:
+    """
+    Reads scraped data from a Parquet file into a pandas DataFrame.
+
+    List and struct columns are restored as Python lists and dicts, matching
+    the objects produced by the scrapers.
+
+    Args:
+        file_path (str): The path to the Parquet file.
+
+    Returns:
+        pd.DataFrame: The DataFrame containing the scraped data.
+    """
+    try:
+        # pyarrow is optional; Parquet copies only exist when it was available to write them.
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(file_path)
+        df = table.to_pandas()
+        df = df.where(pd.notnull(df), None)
+
+        for field in table.schema:
+            if pa.types.is_nested(field.type):
+                df[field.name] = table.column(field.name).to_pylist()
+
+        logger.info(f"Read {len(df)} rows of scraped data from Parquet: {file_path}.")
+        return df
+    except Exception as e:
+        logger.error(
+            f"Error reading scraped data from Parquet at {file_path}: {e}",
+            exc_info=True,
+        )
+        raise Exception(f"Error reading scraped data from Parquet: {e}")
@@ -1,16 +1,23 @@
 import os
+from typing import Optional
 
 import pandas as pd
 
 from app.utils.constants import HOTEL_DETAILS_CSV_PATH_TEMPLATE
+from app.utils.file_io.structured_columns import encode_structured_columns
 from app.utils.logger import logger
 
 
 def save_hotel_detail_data_to_csv(
-    data: pd.DataFrame, destination: str, adults: int, rooms: int, limit: int
+    data: pd.DataFrame,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,
+    chunksize: Optional[int] = 50_000,
 ) -> None:
     """
-    Saves hotel detail data to a CSV file.
+    Saves hotel detail data to a CSV file, storing list/dict columns as JSON.
 
     Args:
         data (pd.DataFrame): The DataFrame containing the hotel detail data.
@@ -18,14 +25,12 @@ def save_hotel_detail_data_to_csv(
         adults (int): The number of adults, used for constructing the file path.
         rooms (int): The number of rooms, used for constructing the file path.
         limit (int): The scraping limit, used for constructing the file path.
+        chunksize (Optional[int]): Number of rows written per batch, bounding the
+                                   intermediate buffer. None writes all rows at once.
     """
     file_path = HOTEL_DETAILS_CSV_PATH_TEMPLATE.format(
         destination=destination, adults=adults, rooms=rooms, limit=limit
     )
-    logger.info(
-        f"Attempting to save hotel detail data to CSV: {file_path}. "
-        f"Destination='{destination}', Adults={adults}, Rooms={rooms}, Limit={limit}"
-    )
     try:
         dir_name = os.path.dirname(file_path)
         if not os.path.exists(dir_name):
@@ -38,7 +43,9 @@ def save_hotel_detail_data_to_csv(
             )
             os.remove(file_path)
 
-        data.to_csv(file_path, index=False)
+        encode_structured_columns(data).to_csv(
+            file_path, index=False, chunksize=chunksize
+        )
         logger.info(
             f"Successfully saved {len(data)} hotel detail records to {file_path}"
         )
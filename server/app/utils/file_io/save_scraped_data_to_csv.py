@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 
 import pandas as pd
 
@@ -7,7 +8,12 @@ from app.utils.logger import logger
 
 
 def save_scraped_data_to_csv(
-    data: pd.DataFrame, destination: str, adults: int, rooms: int, limit: int
+    data: pd.DataFrame,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,
+    chunksize: Optional[int] = 50_000,
 ) -> None:
     """
     Saves scraped property listing data to a CSV file.
@@ -18,21 +24,19 @@ def save_scraped_data_to_csv(
         adults (int): The number of adults, used for constructing the file path.
         rooms (int): The number of rooms, used for constructing the file path.
         limit (int): The scraping limit, used for constructing the file path.
+        chunksize (Optional[int]): Number of rows written per batch, bounding the
+                                   intermediate buffer. None writes all rows at once.
     """
     file_path = PROPERTIES_CSV_PATH_TEMPLATE.format(
         destination=destination, adults=adults, rooms=rooms, limit=limit
     )
-    logger.info(
-        f"Attempting to save scraped data to CSV: {file_path}. "
-        f"Destination='{destination}', Adults={adults}, Rooms={rooms}, Limit={limit}"
-    )
     try:
         dir_name = os.path.dirname(file_path)
         if not os.path.exists(dir_name):
             logger.debug(f"Creating directory for scraped data: {dir_name}")
             os.makedirs(dir_name)
 
-        data.to_csv(file_path, index=False)
+        data.to_csv(file_path, index=False, chunksize=chunksize)
         logger.info(f"Successfully saved {len(data)} scraped properties to {file_path}")
     except Exception as e:
         logger.error(
@@ -0,0 +1,73 @@
+import os
+from typing import List, Optional, get_type_hints
+
+import pandas as pd
+
+from app.data_models import HotelDetails
+from app.utils.constants import get_scraped_data_filepath
+from app.utils.logger import logger
+
+# HotelDetails columns stored as Arrow list<string>, even when every value is missing.
+HOTEL_DETAIL_LIST_COLUMNS = [
+    name
+    for name, hint in get_type_hints(HotelDetails).items()
+    if hint == Optional[List[str]]
+]
+
+
+def save_scraped_data_to_parquet(
+    data: pd.DataFrame,
+    data_type: str,
+    destination: str,
+    adults: int,
+    rooms: int,
+    limit: int,
+) -> None:
+    """
+    Saves scraped data to a Parquet file, keeping list/dict columns in their native types.
+
+    Args:
+        data (pd.DataFrame): The DataFrame containing the scraped data.
+        data_type (str): Either "properties" or "hotel_details".
+        destination (str): The destination string, used for constructing the file path.
+        adults (int): The number of adults, used for constructing the file path.
+        rooms (int): The number of rooms, used for constructing the file path.
+        limit (int): The scraping limit, used for constructing the file path.
+    """
+    file_path = get_scraped_data_filepath(
+        data_type, destination, adults, rooms, limit, file_format="parquet"
+    )
+    try:
+        # pyarrow is optional; without it only the CSV copy is kept.
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        dir_name = os.path.dirname(file_path)
+        if not os.path.exists(dir_name):
+            logger.debug(f"Creating directory for {data_type} data: {dir_name}")
+            os.makedirs(dir_name)
+
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        list_type = pa.list_(pa.string())
+        for i, field in enumerate(table.schema):
+            # Columns with no values at all are inferred as the Arrow null type.
+            if field.name in HOTEL_DETAIL_LIST_COLUMNS and not pa.types.is_list(
+                field.type
+            ):
+                table = table.set_column(
+                    i,
+                    pa.field(field.name, list_type),
+                    pa.array(table.column(i).to_pylist(), type=list_type),
+                )
+        pq.write_table(table, file_path, compression="zstd")
+        logger.info(f"Successfully saved {len(data)} {data_type} records to {file_path}")
+    except ImportError:
+        logger.warning(
+            f"pyarrow is not installed, skipping Parquet copy of {data_type} data."
+        )
+    except Exception as e:
+        logger.error(
+            f"Error saving {data_type} data to Parquet at {file_path}: {e}",
+            exc_info=True,
+        )
+        raise Exception(f"Error saving {data_type} data to Parquet: {e}")
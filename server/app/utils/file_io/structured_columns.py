@@ -0,0 +1,163 @@
+import ast
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder.
+    orjson = None
+
+# HotelDetails fields holding lists or dicts, which have to be stored as text in CSV.
+HOTEL_DETAIL_STRUCTURED_COLUMNS = [
+    "coordinates",
+    "property_highlights",
+    "most_popular_facilities",
+    "bathroom_facilities",
+    "view_type",
+    "outdoor_facilities",
+    "kitchen_facilities",
+    "room_amenities",
+    "activities",
+    "food_drink",
+    "services",
+    "safety_security",
+    "general_facilities",
+    "pool_info",
+    "spa_wellness",
+    "languages_spoken",
+]
+# The structured columns holding dicts; every other one holds a list of strings.
+_DICT_COLUMNS = frozenset({"coordinates", "pool_info"})
+
+# Below this many rows the thread start-up costs more than the encoding itself.
+PARALLEL_ENCODE_MIN_ROWS = 5_000
+
+if orjson is not None:
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+def _decode_value(value: str) -> Any:
+    try:
+        return _loads(value)
+    except ValueError:
+        pass
+    # Files written before the JSON encoding contain Python reprs instead.
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
+def _decode_list_value(value: str) -> Any:
+    """`_decode_value` for a list column, wrapping plain text as a one-item list."""
+    decoded = _decode_value(value)
+    if isinstance(decoded, str):
+        return [decoded] if decoded else []
+    return decoded
+
+
+def _pick_decoder(series: pd.Series) -> Callable[[str], Any]:
+    """Chooses JSON or repr decoding for a column from its first string value."""
+    sample = next((v for v in series if isinstance(v, str)), None)
+    if sample is None:
+        return _loads
+    try:
+        _loads(sample)
+        return _loads
+    except ValueError:
+        return ast.literal_eval
+
+
+def _decode_series(series: pd.Series, decoder: Callable[[str], Any]) -> pd.Series:
+    cache: Dict[str, Any] = {}
+
+    def decode(value: Any) -> Any:
+        if not isinstance(value, str):
+            return None
+        if value not in cache:
+            cache[value] = decoder(value)
+        return cache[value]
+
+    return series.map(decode)
+
+
+def _encode_series(series: pd.Series) -> pd.Series:
+    cache: Dict[Any, str] = {}
+
+    def encode(value: Any) -> Any:
+        if not isinstance(value, (list, dict)):
+            return value
+        key = tuple(value) if isinstance(value, list) else id(value)
+        encoded = cache.get(key)
+        if encoded is None:
+            encoded = _dumps(value)
+            cache[key] = encoded
+        return encoded
+
+    return series.map(encode)
+
+
+def encode_structured_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of the hotel details DataFrame with list/dict columns JSON-encoded.
+
+    Facility lists repeat heavily across hotels, so each distinct value is
+    encoded once per column and reused for the remaining rows. Large frames
+    encode their columns concurrently on a thread pool.
+
+    Args:
+        df (pd.DataFrame): The hotel details DataFrame holding Python lists/dicts.
+
+    Returns:
+        pd.DataFrame: A new DataFrame with the structured columns as JSON strings.
+    """
+    columns = [col for col in HOTEL_DETAIL_STRUCTURED_COLUMNS if col in df.columns]
+    if len(df) >= PARALLEL_ENCODE_MIN_ROWS and len(columns) > 1:
+        max_workers = min(len(columns), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            encoded = executor.map(lambda col: _encode_series(df[col]), columns)
+            encoded_columns = dict(zip(columns, encoded))
+    else:
+        encoded_columns = {col: _encode_series(df[col]) for col in columns}
+
+    return df.assign(**encoded_columns)
+
+
+def decode_structured_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Decodes the JSON (or legacy repr) strings of the hotel details list/dict columns.
+
+    The decoder is chosen once per column from its first value, so uniform
+    files never go through per-value fallbacks. Each distinct string is decoded
+    once and the parsed value is shared by every row holding the same text.
+    Text in a list column that parses as neither is kept as a one-item list.
+
+    Args:
+        df (pd.DataFrame): The hotel details DataFrame as read from CSV.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the structured columns restored to lists/dicts.
+    """
+    for col in HOTEL_DETAIL_STRUCTURED_COLUMNS:
+        if col not in df.columns:
+            continue
+        try:
+            df[col] = _decode_series(df[col], _pick_decoder(df[col]))
+        except (ValueError, SyntaxError):
+            # Mixed or malformed column: try every decoder on each value instead.
+            df[col] = _decode_series(
+                df[col],
+                _decode_value if col in _DICT_COLUMNS else _decode_list_value,
+            )
+    return df
@@ -6,7 +6,7 @@ from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
 
 from app.utils.logger import logger
-from app.utils.file_io.read_scraped_data_from_csv import read_scraped_data_from_csv
+from app.utils.file_io import read_scraped_data_from_csv
 from server.utils import normalize_booking_url
 
 
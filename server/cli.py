@@ -1,11 +1,18 @@
 import asyncio
+from functools import lru_cache
 from typing import Literal, Optional
 
+import click
+
 import typer
 
-from app.core_logic import run_prediction_flow
 from app.utils.logger import logger
 
+try:
+    import uvloop  # Installed with uvicorn[standard]; not available on Windows.
+except ImportError:
+    uvloop = None
+
 cli_app = typer.Typer()
 
 
@@ -44,11 +51,46 @@ def run(
         "Sunset Mirage Villa",
         help="Specific hotel name to target during scraping. Only used when data_source is 'scrape'.",
     ),
+    max_requests_per_second: float = typer.Option(
+        3.0,
+        help="Maximum number of hotel pages opened per second while scraping (0 disables the limit).",
+    ),
+    manual_data_file: Optional[str] = typer.Option(
+        None,
+        help="JSON file ('-' for stdin) with the hotel features for 'manual' mode, used instead of the interactive prompts.",
+    ),
 ):
     """
     Command-line interface to run the Ez-Rent scraper and prediction.
     """
+    if predictor_house_data_source == "scrape" and not target_hotel_name:
+        raise typer.BadParameter(
+            "is required when the data source is 'scrape'.",
+            param_hint="--target-hotel-name",
+        )
+
+    # Imported here so `--help` and option errors don't pay for pandas,
+    # TensorFlow and Playwright.
+    from app.core_logic import run_prediction_flow
+    from app.scrapers.booking_com.processing.rate_limiter import AsyncRateLimiter
+
     try:
+        manual_props_df = manual_details_df = None
+        if predictor_house_data_source == "manual" and manual_data_file:
+            from app.cli.manual_data_entry import load_manual_hotel_data_from_file
+
+            (
+                manual_props_df,
+                manual_details_df,
+            ) = load_manual_hotel_data_from_file(manual_data_file)
+
+        # Shared by every scraping task of the run.
+        rate_limiter = (
+            AsyncRateLimiter(max_rate=max_requests_per_second)
+            if max_requests_per_second > 0
+            else None
+        )
+
         asyncio.run(
             run_prediction_flow(
                 data_source=predictor_house_data_source,
@@ -60,7 +102,11 @@ def run(
                 force_refetch=force_refetch,
                 prediction_model_type=prediction_model_type,
                 target_hotel_name=target_hotel_name,
-            )
+                manual_props_df=manual_props_df,
+                manual_details_df=manual_details_df,
+                rate_limiter=rate_limiter,
+            ),
+            loop_factory=uvloop.new_event_loop if uvloop is not None else None,
         )
     except (ValueError, FileNotFoundError) as e:
         logger.error(f"CLI Error: {e}")
@@ -70,5 +116,11 @@ def run(
         raise typer.Exit(code=1)
 
 
+@lru_cache(maxsize=None)
+def get_cli_command() -> click.Command:
+    """Builds the click command behind `cli_app` once and reuses it on later calls."""
+    return typer.main.get_command(cli_app)
+
+
 if __name__ == "__main__":
-    cli_app()
+    get_cli_command()()
@@ -1,7 +1,7 @@
 import os
 import re
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import pandas as pd
 from fastapi import APIRouter, HTTPException, Query
@@ -10,7 +10,7 @@ from app.core_logic import run_prediction_flow
 from app.utils.constants import (
     get_all_prediction_files_metadata,  # This might become obsolete
 )
-from app.utils.file_io.read_scraped_data_from_csv import read_scraped_data_from_csv
+from app.utils.file_io import read_scraped_data_from_csv
 from app.utils.logger import logger
 from app.utils.scraped_data_loader import (  # New imports
     deduplicate_by_latest,
@@ -27,6 +27,35 @@ from server.schemas import (
 router = APIRouter()
 
 
+def _iter_history_entries(
+    entries_df: pd.DataFrame,
+) -> Iterator[PredictionHistoryEntry]:
+    """Yields a PredictionHistoryEntry per row of the prediction metadata frame."""
+    columns = entries_df.columns.tolist()
+    for row in entries_df.itertuples(index=False, name=None):
+        # Ensure 'timestamp' is in string format for PredictionHistoryEntry
+        entry_data = dict(zip(columns, row))
+        if isinstance(entry_data.get("timestamp"), datetime):
+            entry_data["timestamp"] = entry_data["timestamp"].strftime("%Y%m%d_%H%M%S")
+
+        # Need to ensure all fields expected by PredictionHistoryEntry are present, or make them optional
+        # Based on its definition: model_type, destination, adults, rooms, properties_limit, hotel_details_limit, timestamp, filename, full_path
+
+        yield PredictionHistoryEntry(
+            model_type=entry_data.get("model_type"),
+            destination=entry_data.get("destination"),
+            adults=entry_data.get("adults"),
+            rooms=entry_data.get("rooms"),
+            properties_limit=entry_data.get("properties_limit"),
+            hotel_details_limit=entry_data.get("hotel_details_limit"),
+            timestamp=entry_data.get(
+                "timestamp"
+            ),  # Now this should be a string from strftime
+            filename=entry_data.get("filename"),
+            full_path=entry_data.get("full_path"),
+        )
+
+
 @router.post(
     "/scrape-and-predict",
     response_model=PredictionResponse,
@@ -105,33 +134,11 @@ async def get_prediction_history(
             filtered_entries_df["model_type"] == model_type
         ]
 
-    all_entries = []
-    for _, row in filtered_entries_df.iterrows():
-        # Ensure 'timestamp' is in string format for PredictionHistoryEntry
-        entry_data = row.to_dict()
-        if isinstance(entry_data.get("timestamp"), datetime):
-            entry_data["timestamp"] = entry_data["timestamp"].strftime("%Y%m%d_%H%M%S")
-
-        # Need to ensure all fields expected by PredictionHistoryEntry are present, or make them optional
-        # Based on its definition: model_type, destination, adults, rooms, properties_limit, hotel_details_limit, timestamp, filename, full_path
-
-        entry = PredictionHistoryEntry(
-            model_type=entry_data.get("model_type"),
-            destination=entry_data.get("destination"),
-            adults=entry_data.get("adults"),
-            rooms=entry_data.get("rooms"),
-            properties_limit=entry_data.get("properties_limit"),
-            hotel_details_limit=entry_data.get("hotel_details_limit"),
-            timestamp=entry_data.get(
-                "timestamp"
-            ),  # Now this should be a string from strftime
-            filename=entry_data.get("filename"),
-            full_path=entry_data.get("full_path"),
-        )
-        all_entries.append(entry)
-
-    total_entries = len(all_entries)
-    paginated_entries = all_entries[skip : skip + page_size]
+    # Only the requested page is turned into response models.
+    total_entries = len(filtered_entries_df)
+    paginated_entries = list(
+        _iter_history_entries(filtered_entries_df.iloc[skip : skip + page_size])
+    )
 
     return PredictionHistoryResponse(
         predictions=paginated_entries,
@@ -168,7 +175,9 @@ async def fetch_prediction_data(
     # Filter by model_type and hotel_name
     filtered_by_hotel_and_model = df_all_predictions[
         (df_all_predictions["model_type"] == model_type)
-        & (df_all_predictions["name"].str.contains(hotel_name, case=False, na=False))
+        & df_all_predictions["name"].str.contains(
+            hotel_name, case=False, na=False, regex=False
+        )
     ]
 
     if filtered_by_hotel_and_model.empty:
@@ -198,7 +207,9 @@ async def fetch_prediction_data(
 
     # Filter again by hotel_name in case the file contains multiple hotels
     df_predictions_for_file = df_predictions_for_file[
-        df_predictions_for_file["name"].str.contains(hotel_name, case=False, na=False)
+        df_predictions_for_file["name"].str.contains(
+            hotel_name, case=False, na=False, regex=False
+        )
     ]
 
     if df_predictions_for_file.empty:
@@ -1,14 +1,13 @@
-import ast
 import os
 from dataclasses import fields
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional, get_type_hints
 
 import pandas as pd
 from fastapi import APIRouter, HTTPException, Query
 
-from app.data_models import HotelDetails, PropertyListing
+from app.data_models import HotelDetails, PropertyListing, PROPERTY_LISTING_FIELDS
 from app.utils.constants import get_scraped_data_filepath # This might become obsolete
-from app.utils.file_io.read_scraped_data_from_csv import read_scraped_data_from_csv
+from app.utils.file_io import read_scraped_data_from_csv
 from app.utils.logger import logger
 from server.schemas import PropertyDetailsResponse, PaginatedPropertiesResponse
 from server.utils import normalize_booking_url
@@ -17,6 +16,15 @@ from app.utils.scraped_data_loader import get_all_properties_data, get_all_hotel
 
 router = APIRouter()
 
+_PROPERTY_HINTS = get_type_hints(PropertyListing)
+# Casts applied before building PropertyListing objects so rows hold plain Python scalars
+_PROPERTY_DTYPES = {
+    name: "float64" for name, hint in _PROPERTY_HINTS.items() if hint == Optional[float]
+}
+_PROPERTY_STR_DEFAULTS = {
+    name: "" for name, hint in _PROPERTY_HINTS.items() if hint is str
+}
+
 
 @router.get(
     "/properties",
@@ -42,10 +50,13 @@ async def get_all_properties(
     total_properties = len(df_deduplicated)
     paginated_df = df_deduplicated.iloc[skip : skip + page_size]
 
-    properties = [
-        PropertyListing(**row)
-        for row in paginated_df.to_dict(orient="records")
-    ]
+    paginated_df = (
+        paginated_df.reindex(columns=list(PROPERTY_LISTING_FIELDS))
+        .astype(_PROPERTY_DTYPES)
+        .fillna(_PROPERTY_STR_DEFAULTS)
+    )
+    columns = [paginated_df[name].tolist() for name in PROPERTY_LISTING_FIELDS]
+    properties = [PropertyListing(*row) for row in zip(*columns)]
 
     return PaginatedPropertiesResponse(properties=properties, total=total_properties, skip=skip, page_size=page_size)
 
@@ -71,7 +82,9 @@ async def get_property_details(
 
     # Filter properties by hotel name
     property_listing_matches = df_all_properties[
-        df_all_properties["name"].str.contains(hotel_name, case=False, na=False)
+        df_all_properties["name"].str.contains(
+            hotel_name, case=False, na=False, regex=False
+        )
     ]
 
     if property_listing_matches.empty:
@@ -127,19 +140,6 @@ async def get_property_details(
                 .where(pd.notnull(latest_hotel_details_entry), None)
                 .to_dict()
             )
-            list_like_cols = [
-                "most_popular_facilities", "bathroom_facilities", "view_type",
-                "outdoor_facilities", "kitchen_facilities", "room_amenities",
-                "activities", "food_drink", "services", "safety_security",
-                "general_facilities", "spa_wellness", "languages_spoken",
-                "property_highlights",
-            ]
-            for col in list_like_cols:
-                if col in details_dict and isinstance(details_dict[col], str):
-                    try:
-                        details_dict[col] = ast.literal_eval(details_dict[col])
-                    except (ValueError, SyntaxError):
-                        details_dict[col] = [details_dict[col]] if details_dict[col] else []
             hd_fields = {f.name for f in fields(HotelDetails)}
             hotel_details = HotelDetails(
                 **{k: v for k, v in details_dict.items() if k in hd_fields}
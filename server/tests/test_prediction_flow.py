@@ -0,0 +1,57 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from app import core_logic  # noqa: E402
+from app.prediction import model_predictor  # noqa: E402
+
+
+def test_cli_prediction_flow_saves_results(monkeypatch, tmp_path):
+    """The predictions CSV is written by the time the flow returns."""
+    results_path = tmp_path / "predictions.csv"
+
+    async def collect_user_data(*args):
+        return pd.DataFrame({"name": ["Target Hotel"], "star_rating": [4.0]}), None
+
+    monkeypatch.setitem(core_logic._DATA_COLLECTORS, "scrape", collect_user_data)
+    monkeypatch.setattr(
+        model_predictor,
+        "load_model_artifacts",
+        lambda model_filename, model_type: {
+            "meta": {
+                "features": ["star_rating"],
+                "binary_features": [],
+                "currency": "USD",
+            },
+            "inference": lambda X: np.asarray(X[:, :1]) * 10,
+        },
+    )
+    monkeypatch.setattr(
+        model_predictor, "get_prediction_filepath", lambda *args: str(results_path)
+    )
+
+    async def run_flow() -> pd.DataFrame:
+        predicted = await core_logic.run_prediction_flow(
+            data_source="scrape",
+            destination="Unawatuna",
+            adults=2,
+            rooms=1,
+            properties_limit=10,
+            hotel_details_limit=5,
+            force_refetch=False,
+            prediction_model_type="basic",
+            target_hotel_name="Target Hotel",
+        )
+        # Checked before the loop gets to run anything else, as the CLI's
+        # `asyncio.run` cancels whatever is still pending once the flow returns.
+        assert results_path.exists()
+        return predicted
+
+    predicted = asyncio.run(run_flow())
+
+    saved = pd.read_csv(results_path)
+    assert saved["predicted_price"].tolist() == predicted["predicted_price"].tolist()
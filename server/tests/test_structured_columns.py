@@ -0,0 +1,18 @@
+from app.utils.file_io import read_scraped_data_from_csv
+
+
+def test_plain_text_list_cells_read_as_one_item_lists(tmp_path):
+    """List cells that are neither JSON nor a Python repr come back as [text]."""
+    csv_path = tmp_path / "hotel_details.csv"
+    csv_path.write_text(
+        "url,property_highlights,languages_spoken,coordinates\n"
+        'https://a,"[""Pool"", ""Free WiFi""]",English,'
+        '"{""lat"": 6.0, ""lng"": 80.2}"\n'
+        "https://b,Beachfront,\"['English', 'Sinhala']\",\n"
+    )
+
+    df = read_scraped_data_from_csv(str(csv_path), is_hotel_detail=True)
+
+    assert df["property_highlights"].tolist() == [["Pool", "Free WiFi"], ["Beachfront"]]
+    assert df["languages_spoken"].tolist() == [["English"], ["English", "Sinhala"]]
+    assert df["coordinates"].tolist() == [{"lat": 6.0, "lng": 80.2}, None]